@@ -18,7 +18,6 @@ def forge_node(state: AgentState) -> AgentState:
     """Hephaestus: Forge (Implementation)."""
     print(f"🔨 Hephaestus: Working on task '{state['task']}'")
     return {
-        **state,
         "logs": [f"Hephaestus implemented: {state['task'][:20]}..."],
         "result": "Code implemented and linted.",
         "status": "success",
@@ -29,7 +28,6 @@ def oracle_node(state: AgentState) -> AgentState:
     """Oracle: Validation."""
     print(f"👁️ Oracle: Validating implementation for '{state['task']}'")
     return {
-        **state,
         "logs": [f"Oracle validated: {state['result']}"],
         "status": "verified",
     }
@@ -28,9 +28,9 @@ def sisyphus_orchestrator(state: ProtocolState) -> ProtocolState:
 
     # Update main state with agent results
     fact = f"Hephaestus completed: {task_desc} (Status: {agent_output['status']})"
+    now = datetime.now().isoformat()
 
     return {
-        **state,
         "facts_discovered": [fact],
         "steps_completed": [
             {
@@ -39,9 +39,9 @@ def sisyphus_orchestrator(state: ProtocolState) -> ProtocolState:
                 "action": f"Sisyphus delegated to Hephaestus: {task_desc}",
                 "outcome": agent_output["result"],
                 "status": agent_output["status"],
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now,
             }
         ],
         "current_step_index": state["current_step_index"] + 1,
-        "last_updated": datetime.now().isoformat(),
+        "last_updated": now,
     }
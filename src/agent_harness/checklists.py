@@ -1,8 +1,18 @@
 import json
-from collections.abc import Callable
+import os
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+from agent_harness import _json
+
+# Upper bound on validators run at once by ChecklistManager.run_phase
+_MAX_WORKERS = 8
+
+# Parsed checklists by file path, with the (mtime_ns, size) they were read at
+_parsed_checklists: dict[str, tuple[tuple[int, int], "ChecklistPhase | None"]] = {}
+
 
 class ChecklistCheck:
     def __init__(self, data: dict[str, Any]):
@@ -26,21 +36,39 @@ class ChecklistManager:
     def __init__(self, checklist_dir: Path):
         self.checklist_dir = checklist_dir
         self.validators: dict[str, Callable] = {}
+        # Validators with side effects (e.g. posting to bd); never run concurrently
+        self.mutating: set[str] = set()
 
-    def register_validator(self, name: str, func: Callable):
+    def register_validator(self, name: str, func: Callable, mutating: bool = False):
         self.validators[name] = func
+        if mutating:
+            self.mutating.add(name)
+
+    def register_validators(self, validators: Mapping[str, Callable]):
+        self.validators.update(validators)
 
     def load_checklist(self, name: str) -> ChecklistPhase | None:
         path = self.checklist_dir / f"{name}.json"
-        if not path.exists():
+        try:
+            st = os.stat(path)
+        except OSError:
             return None
 
-        with open(path) as f:
-            data = json.load(f)
-            # The schema has a 'phases' array at the top level
-            if "phases" in data and len(data["phases"]) > 0:
-                return ChecklistPhase(data["phases"][0])
-        return None
+        # Nodes build a fresh manager on every graph step; reuse the parsed
+        # checklist until the file changes
+        key = str(path)
+        version = (st.st_mtime_ns, st.st_size)
+        cached = _parsed_checklists.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        phase = None
+        data = _json.loads(path.read_bytes())
+        # The schema has a 'phases' array at the top level
+        if "phases" in data and len(data["phases"]) > 0:
+            phase = ChecklistPhase(data["phases"][0])
+        _parsed_checklists[key] = (version, phase)
+        return phase
 
     def run_check(self, check: ChecklistCheck) -> tuple[bool, str]:
         if check.validator_name not in self.validators:
@@ -56,21 +84,76 @@ class ChecklistManager:
         except Exception as e:
             return False, f"Error running validator '{check.validator_name}': {str(e)}"
 
-    def run_phase(self, phase_name: str) -> tuple[bool, list[str], list[str]]:
+    def run_phase(
+        self, phase_name: str, fail_fast: bool = False
+    ) -> tuple[bool, list[str], list[str]]:
+        """
+        Run every check of a phase.
+
+        Read-only validators are independent and mostly wait on git/bd/gh
+        subprocesses, so they run concurrently; checks that call the same
+        validator with the same args share one run. Mutating validators run
+        afterwards, one at a time, and only if no blocker was found. Results
+        are reported in checklist order.
+        With fail_fast, the first failing BLOCKER ends the phase: read-only
+        checks that have not started are cancelled (running ones are still waited
+        for, so none outlives the phase), and every later check is listed as
+        skipped in the warnings.
+        """
         phase = self.load_checklist(phase_name)
         if not phase:
             return False, [f"Checklist '{phase_name}' not found"], []
 
+        checks = phase.checks
+        results: dict[int, tuple[bool, str]] = {}
+        blocked = False
+
+        workers = min(_MAX_WORKERS, len(checks)) or 1
+        pool = ThreadPoolExecutor(max_workers=workers)
+        try:
+            submitted = {}
+            futures = {}
+            for i, check in enumerate(checks):
+                if check.validator_name in self.mutating:
+                    continue
+                key = (check.validator_name, json.dumps(check.args))
+                if key not in submitted:
+                    submitted[key] = pool.submit(self.run_check, check)
+                futures[i] = submitted[key]
+            for i, future in futures.items():
+                results[i] = future.result()
+                if not results[i][0] and checks[i].type == "BLOCKER":
+                    blocked = True
+                    if fail_fast:
+                        break
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+        if not blocked:
+            for i, check in enumerate(checks):
+                if check.validator_name in self.mutating:
+                    results[i] = self.run_check(check)
+                    if not results[i][0] and check.type == "BLOCKER" and fail_fast:
+                        break
+
         blockers = []
         warnings = []
-
-        for check in phase.checks:
-            passed, msg = self.run_check(check)
-            if not passed:
-                if check.type == "BLOCKER":
-                    blockers.append(f"{check.description}: {msg}")
-                else:
-                    warnings.append(f"{check.description}: {msg}")
+        for i, check in enumerate(checks):
+            if i not in results:
+                warnings.append(f"{check.description}: Skipped after blocker")
+                continue
+            passed, msg = results[i]
+            if passed:
+                continue
+            if check.type != "BLOCKER":
+                warnings.append(f"{check.description}: {msg}")
+                continue
+            blockers.append(f"{check.description}: {msg}")
+            if fail_fast:
+                warnings.extend(
+                    f"{skipped.description}: Skipped after blocker" for skipped in checks[i + 1 :]
+                )
+                break
 
         passed = len(blockers) == 0
         return passed, blockers, warnings
@@ -1,14 +1,33 @@
 from __future__ import annotations
 
+import os
+
 from langgraph.graph import END, StateGraph
+from langgraph.graph.state import CompiledStateGraph
 
 from agent_harness.nodes.execution import execution_node, human_approval_node
 from agent_harness.nodes.finalization import finalization_node, retrospective_node
 from agent_harness.nodes.initialization import initialization_node
-from agent_harness.persistence import get_sqlite_checkpointer
+from agent_harness.persistence import DB_PATH, ensure_db_directory, get_sqlite_checkpointer
 from agent_harness.state import ProtocolState
 
 
+def _route_on(pass_key: str, next_node: str):
+    """Build a router that continues to `next_node` once `pass_key` is set, else ends."""
+
+    def route(state: ProtocolState):
+        if state[pass_key]:
+            return next_node
+        return END
+
+    route.__name__ = f"route_after_{pass_key.removesuffix('_passed')}"
+    return route
+
+
+route_after_initialization = _route_on("initialization_passed", "approval")
+route_after_finalization = _route_on("finalization_passed", "retrospective")
+
+
 def create_harness_graph(checkpointer=None):
     """
     Creates and compiles the agentic Protocol harness graph.
@@ -26,11 +45,6 @@ def create_harness_graph(checkpointer=None):
     builder.set_entry_point("initialization")
 
     # After initialization, if passed, go to approval. If failed, end (blocked).
-    def route_after_initialization(state: ProtocolState):
-        if state["initialization_passed"]:
-            return "approval"
-        return END
-
     builder.add_conditional_edges("initialization", route_after_initialization)
 
     # After approval (which has an interrupt), go to execution
@@ -40,11 +54,6 @@ def create_harness_graph(checkpointer=None):
     builder.add_edge("execution", "finalization")
 
     # After finalization, go to retrospective if passed
-    def route_after_finalization(state: ProtocolState):
-        if state["finalization_passed"]:
-            return "retrospective"
-        return END
-
     builder.add_conditional_edges("finalization", route_after_finalization)
     builder.add_edge("retrospective", END)
 
@@ -52,40 +61,88 @@ def create_harness_graph(checkpointer=None):
     return builder.compile(checkpointer=checkpointer, interrupt_before=["approval"])
 
 
+# Scalar defaults for a new process; list fields are built fresh per run
+_INITIAL_STATE_TEMPLATE = {
+    "current_phase": "INIT",
+    "current_step_index": 0,
+    "stall_count": 0,
+    "initialization_passed": False,
+    "finalization_passed": False,
+    "git_fingerprint": None,
+    "awaiting_approval": True,
+    "user_feedback": None,
+    "last_updated": "",
+}
+
+
+# Compiled graph per database path, with the identity of the file it was opened on
+_graphs: dict[str | None, tuple[tuple[int, int] | None, CompiledStateGraph]] = {}
+
+
+def _compiled_graph(db_path: str | None, db_file_id: tuple[int, int] | None):
+    """Compile the harness graph once per database file.
+
+    When the file at `db_path` has been replaced, the graph is rebuilt and the
+    connection held by the old one is closed rather than left open.
+    """
+    cached = _graphs.get(db_path)
+    if cached is not None:
+        cached_id, graph = cached
+        if cached_id == db_file_id:
+            return graph
+        graph.checkpointer.conn.close()
+    graph = create_harness_graph(get_sqlite_checkpointer(db_path))
+    _graphs[db_path] = (db_file_id, graph)
+    return graph
+
+
+def _db_file_id(db_path: str | None) -> tuple[int, int] | None:
+    """
+    Identify the on-disk database so a deleted or replaced file gets a fresh graph.
+
+    The file is created up front (sqlite accepts an empty file) so the identity
+    recorded here is the inode the cached connection ends up holding open. While
+    it is open that inode cannot be freed, so a new file never reuses its number.
+    """
+    if db_path == ":memory:":
+        return None
+    if db_path is None:
+        ensure_db_directory()
+        db_path = str(DB_PATH)
+    with open(db_path, "ab"):
+        pass
+    st = os.stat(db_path)
+    return st.st_dev, st.st_ino
+
+
 def run_harness(process_id: str, description: str, thread_id: str, db_path: str | None = None):
     """
     Run the compiled harness graph.
     """
-    checkpointer = get_sqlite_checkpointer(db_path)
-    graph = create_harness_graph(checkpointer)
+    graph = _compiled_graph(db_path, _db_file_id(db_path))
 
     initial_state = {
+        **_INITIAL_STATE_TEMPLATE,
         "process_id": process_id,
         "process_description": description,
-        "current_phase": "INIT",
         "goals": [],
         "tasks": [],
         "facts_discovered": [],
         "educated_guesses": [],
         "steps_completed": [],
-        "current_step_index": 0,
-        "stall_count": 0,
-        "initialization_passed": False,
-        "finalization_passed": False,
         "blockers": [],
         "warnings": [],
-        "awaiting_approval": True,
         "approval_request": f"Approve start of process {process_id}",
-        "user_feedback": None,
-        "last_updated": "",
     }
 
     config = {"configurable": {"thread_id": thread_id}}
 
-    # Check if we have existing state (resume)
-    state = graph.get_state(config)
-    if state and state.values:
-        print(f"🔄 Resuming process {process_id} from {state.values['current_phase']}")
+    # Check if we have existing state (resume); a raw checkpoint lookup avoids
+    # materialising the full graph state for brand-new threads
+    saved = graph.checkpointer.get_tuple(config)
+    values = saved.checkpoint["channel_values"] if saved else None
+    if values:
+        print(f"🔄 Resuming process {process_id} from {values.get('current_phase')}")
         return graph.invoke(None, config)
     else:
         print(f"🚀 Starting process {process_id}")
@@ -0,0 +1,138 @@
+"""
+One-shot git state shared by the validators of a checklist pass.
+
+Several validators need the current branch and the working-tree status. Inside
+`git_snapshot_pass()` they read both from a single
+`git status --porcelain -b -z` call instead of each spawning git.
+
+Nodes also keep a timestamped fingerprint of that snapshot in the graph state,
+so a phase that runs right after another reuses its read instead of querying
+git again.
+"""
+
+import os
+import subprocess
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+
+@dataclass
+class GitSnapshot:
+    """Branch and porcelain status entries captured from one git status call"""
+
+    branch: str  # empty when HEAD is detached, like `git branch --show-current`
+    entries: list[tuple[str, str]] = field(default_factory=list)  # (XY, path)
+
+    @property
+    def clean(self) -> bool:
+        return not self.entries
+
+    @property
+    def untracked(self) -> list[str]:
+        return [path for xy, path in self.entries if xy == "??"]
+
+    @property
+    def modified(self) -> list[str]:
+        return [path for xy, path in self.entries if xy not in ("??", "!!")]
+
+    def porcelain(self) -> str:
+        """The entries as `git status --porcelain` prints them."""
+        return "\n".join(f"{xy} {path}" for xy, path in self.entries)
+
+
+def _parse_branch(header: str) -> str:
+    # "main...origin/main [ahead 1]", "No commits yet on main", "HEAD (no branch)"
+    if header.startswith(("No commits yet on ", "Initial commit on ")):
+        return header.rpartition(" on ")[2]
+    if header.startswith("HEAD (no branch)"):
+        return ""
+    return header.split("...", 1)[0].split(" ", 1)[0]
+
+
+def collect_git_snapshot() -> GitSnapshot | None:
+    """Capture branch and status in one git call, or None if git fails."""
+    try:
+        result = subprocess.run(
+            [
+                "git",
+                "--no-optional-locks",
+                "status",
+                "--porcelain",
+                "-b",
+                "-z",
+                "--no-ahead-behind",
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+
+    records = iter(result.stdout.split(b"\0"))
+    header = os.fsdecode(next(records, b""))
+    if not header.startswith("## "):
+        return None
+    snapshot = GitSnapshot(branch=_parse_branch(header[3:]))
+    for record in records:
+        if not record:
+            continue
+        xy, path = record[:2].decode(), os.fsdecode(record[3:])
+        if "R" in xy or "C" in xy:
+            # Renames and copies are followed by their source path
+            path = f"{os.fsdecode(next(records, b''))} -> {path}"
+        snapshot.entries.append((xy, path))
+    return snapshot
+
+
+# How long a fingerprint left in the graph state by an earlier node stays usable
+FINGERPRINT_MAX_AGE = 5.0
+
+
+def snapshot_fingerprint(snapshot: GitSnapshot | None) -> dict | None:
+    """A state-serializable record of `snapshot`, stamped with the current time."""
+    if snapshot is None:
+        return None
+    return {
+        "branch": snapshot.branch,
+        "entries": [list(entry) for entry in snapshot.entries],
+        "ts": time.time(),
+    }
+
+
+def snapshot_from_fingerprint(
+    fingerprint: dict | None, max_age: float = FINGERPRINT_MAX_AGE
+) -> GitSnapshot | None:
+    """The snapshot recorded in `fingerprint`, or None if missing or too old."""
+    if not fingerprint or time.time() - fingerprint.get("ts", 0) >= max_age:
+        return None
+    return GitSnapshot(
+        branch=fingerprint["branch"],
+        entries=[(xy, path) for xy, path in fingerprint["entries"]],
+    )
+
+
+_current: GitSnapshot | None = None
+
+
+def current_git_snapshot() -> GitSnapshot | None:
+    """The snapshot of the active checklist pass, if any."""
+    return _current
+
+
+@contextmanager
+def git_snapshot_pass(reuse: GitSnapshot | None = None) -> Iterator[GitSnapshot | None]:
+    """Share one git snapshot with every validator run inside the block.
+
+    `reuse` supplies a snapshot taken earlier; git is only queried without one.
+    """
+    global _current
+    _current = reuse if reuse is not None else collect_git_snapshot()
+    try:
+        yield _current
+    finally:
+        _current = None
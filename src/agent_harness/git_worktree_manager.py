@@ -5,11 +5,241 @@ Git worktree management with cleanup validation (agent-6x9.4)
 Uses subprocess for git commands (consistent with existing codebase)
 """
 
+import fnmatch
+import os
+import re
+import stat
 import subprocess
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Temporary-file patterns (mirrors cleanup_patterns.txt)
+TEMP_PATTERNS = (
+    "*.tmp",
+    "*.temp",
+    "*_scratch.*",
+    "debug_*",
+    "test_temp_*",
+    "WIP_*",
+    "*.notes",
+)
+
+LARGE_FILE_BYTES = 10_000_000
+
+# Violation messages show at most this many example names per check
+MAX_EXAMPLES = 3
+
+# Worktrees untouched for longer than this are candidates for orphan cleanup
+ORPHAN_AGE_SECONDS = 24 * 3600
+
+# All patterns folded into one regex: most names match none of them, and those
+# are rejected in a single match() call
+_TEMP_RE = re.compile("|".join(fnmatch.translate(p) for p in TEMP_PATTERNS))
+_TEMP_MATCHERS = tuple((p, re.compile(fnmatch.translate(p)).match) for p in TEMP_PATTERNS)
+
+
+def _walk(root: Path):
+    """Yield (path, lstat) for every entry under root, skipping .git* entries.
+
+    Pruning by name means .git (and .github, .gitignore, ...) are never
+    descended into or yielded.
+
+    Built on os.scandir so each entry's type and stat come from the directory
+    listing instead of separate is_file()/stat() calls.
+    """
+    stack = [os.scandir(root)]
+    try:
+        while stack:
+            for entry in stack[-1]:
+                if entry.name.startswith(".git"):
+                    continue
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                yield entry.path, st
+                if stat.S_ISDIR(st.st_mode):
+                    try:
+                        stack.append(os.scandir(entry.path))
+                    except OSError:
+                        continue
+                    break
+            else:
+                stack.pop().close()
+    finally:
+        for it in stack:
+            it.close()
+
+
+def _record_temp_name(name: str, temp_hits: dict) -> bool:
+    """Record name under each temp pattern it matches; return whether any hit was added."""
+    added = False
+    if _TEMP_RE.match(name):
+        for pattern, match in _TEMP_MATCHERS:
+            names = temp_hits[pattern]
+            if len(names) < MAX_EXAMPLES and match(name):
+                names.append(name)
+                added = True
+    return added
+
+
+def _record_entry(name: str, st: os.stat_result, temp_hits: dict, large_files: list) -> bool:
+    added = _record_temp_name(name, temp_hits)
+    if (
+        len(large_files) < MAX_EXAMPLES
+        and stat.S_ISREG(st.st_mode)
+        and st.st_size > LARGE_FILE_BYTES
+    ):
+        large_files.append(name)
+        added = True
+    return added
+
+
+def _saturated(temp_hits: dict, large_files: list) -> bool:
+    """Whether every check already has enough examples, so scanning can stop."""
+    return len(large_files) >= MAX_EXAMPLES and all(
+        len(names) >= MAX_EXAMPLES for names in temp_hits.values()
+    )
+
+
+def _scan_subtree(root: str) -> tuple[dict[str, list[str]], list[str]]:
+    """Collect temp-pattern hits and large files below one directory."""
+    temp_hits = {pattern: [] for pattern in TEMP_PATTERNS}
+    large_files = []
+    for path, st in _walk(root):
+        if _record_entry(os.path.basename(path), st, temp_hits, large_files) and _saturated(
+            temp_hits, large_files
+        ):
+            break
+    return temp_hits, large_files
+
+
+def _scan_filesystem(worktree_path: Path) -> tuple[dict[str, list[str]], list[str]]:
+    """Walk the worktree directly; used when git cannot list its files."""
+    # Directory scans are metadata-bound and release the GIL, so each
+    # top-level subdirectory is walked on its own thread.
+    temp_hits = {pattern: [] for pattern in TEMP_PATTERNS}
+    large_files = []
+    subdirs = []
+    with os.scandir(worktree_path) as it:
+        for entry in it:
+            if entry.name.startswith(".git"):
+                continue
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            _record_entry(entry.name, st, temp_hits, large_files)
+            if stat.S_ISDIR(st.st_mode):
+                subdirs.append(entry.path)
+
+    if subdirs and not _saturated(temp_hits, large_files):
+        workers = min(32, (os.cpu_count() or 1) * 4, len(subdirs))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for sub_hits, sub_large in pool.map(_scan_subtree, subdirs):
+                for pattern, names in sub_hits.items():
+                    temp_hits[pattern].extend(names)
+                large_files.extend(sub_large)
+    return temp_hits, large_files
+
+
+def _git_listed_files(worktree_path: Path) -> tuple[list[str], bool] | None:
+    """
+    Return tracked and untracked (non-ignored) paths relative to the worktree,
+    plus whether any of them are untracked.
+    """
+    try:
+        result = subprocess.run(
+            ["git", "ls-files", "-oc", "-t", "--exclude-standard", "-z"],
+            cwd=worktree_path,
+            capture_output=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    # Each record is "<tag> <path>"; "?" tags untracked files
+    records = [r for r in result.stdout.split(b"\0") if r]
+    has_untracked = any(r.startswith(b"? ") for r in records)
+    return [os.fsdecode(r[2:]) for r in records], has_untracked
+
+
+def _has_tracked_changes(worktree_path: Path) -> bool:
+    """Whether tracked files differ from HEAD (staged or not), from git's exit code alone."""
+    result = subprocess.run(
+        ["git", "diff", "--quiet", "HEAD", "--"],
+        cwd=worktree_path,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    if result.returncode in (0, 1):
+        return result.returncode == 1
+    # No HEAD yet (or another diff failure): fall back to a full status
+    status = subprocess.run(
+        ["git", "status", "--porcelain"],
+        cwd=worktree_path,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return bool(status.stdout.strip())
+
+
+def _head_blob_sizes(worktree_path: Path) -> dict[str, int]:
+    """Map each path committed at HEAD to its blob size, via git ls-tree -l."""
+    try:
+        result = subprocess.run(
+            ["git", "ls-tree", "-r", "-l", "-z", "HEAD"],
+            cwd=worktree_path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return {}
+    sizes = {}
+    # Each record is "<mode> <type> <object> <size>\t<path>"; submodules have size "-"
+    for record in result.stdout.split(b"\0"):
+        meta, _, path = record.partition(b"\t")
+        size = meta.rpartition(b" ")[2]
+        if size.isdigit():
+            sizes[os.fsdecode(path)] = int(size)
+    return sizes
+
+
+def _head_mtime(worktree_path: Path) -> float | None:
+    """mtime of the worktree's HEAD file, or None if it cannot be found.
+
+    In a linked worktree .git is a file pointing at the real git directory.
+    """
+    git_path = os.path.join(worktree_path, ".git")
+    try:
+        if os.path.isfile(git_path):
+            with open(git_path) as f:
+                gitdir = f.read().strip().removeprefix("gitdir: ")
+            git_path = os.path.join(worktree_path, gitdir)
+        return os.stat(os.path.join(git_path, "HEAD")).st_mtime
+    except OSError:
+        return None
+
+
+def _is_abandoned(worktree_path: Path, cutoff: float) -> bool:
+    """Whether a worktree has had no activity since cutoff and has no changes."""
+    # Check age (older than 24 hours with no recent activity)
+    try:
+        # A recently moved HEAD (commit, checkout) means the worktree is in
+        # use; two stat calls rule that out before spawning git status
+        if worktree_path.stat().st_mtime >= cutoff or (_head_mtime(worktree_path) or 0) >= cutoff:
+            return False
+        # Check if it's truly abandoned
+        result = subprocess.run(
+            ["git", "status", "--porcelain"], cwd=worktree_path, capture_output=True, text=True
+        )
+    except Exception:  # nosec
+        return False
+    return result.returncode == 0 and not result.stdout.strip()
+
 
 class WorktreeCleanupError(Exception):
     """Raised when worktree cleanup validation fails"""
@@ -95,77 +325,95 @@ class GitWorktreeManager:
 
         violations = []
 
+        # Checks 1 and 3: let git enumerate candidate files (tracked plus untracked,
+        # minus ignored paths such as node_modules) instead of walking the tree
+        listed = _git_listed_files(worktree_path)
+        status_error = False
+        if listed is None:
+            temp_hits, large_files = _scan_filesystem(worktree_path)
+            has_changes = False
+            status_error = True
+        else:
+            listed, has_untracked = listed
+            # Untracked files are already known from the listing, so git only has
+            # to compare tracked content with HEAD
+            try:
+                tracked_changes = _has_tracked_changes(worktree_path)
+            except subprocess.CalledProcessError:
+                tracked_changes = True
+                status_error = True
+            has_changes = has_untracked or tracked_changes
+
+            # When tracked files match HEAD, their sizes come from one git read
+            # instead of a stat() per file
+            head_sizes = {} if tracked_changes else _head_blob_sizes(worktree_path)
+
+            # One pass over the listing feeds both the temp-name and size checks
+            temp_hits = {pattern: [] for pattern in TEMP_PATTERNS}
+            large_files = []
+            for rel_path in listed:
+                # Skip paths with a .git* component (.github, .gitignore, ...)
+                if rel_path.startswith(".git") or "/.git" in rel_path:
+                    continue
+                name = rel_path.rpartition("/")[2]
+                added = _record_temp_name(name, temp_hits)
+                if len(large_files) < MAX_EXAMPLES:
+                    size = head_sizes.get(rel_path)
+                    if size is None:
+                        try:
+                            size = os.stat(os.path.join(worktree_path, rel_path)).st_size
+                        except OSError:
+                            continue
+                    if size > LARGE_FILE_BYTES:
+                        large_files.append(name)
+                        added = True
+                # Stop once every check has enough examples for its message
+                if added and _saturated(temp_hits, large_files):
+                    break
+
         # Check 1: Temporary files using existing patterns
-        temp_patterns = [
-            "*.tmp",
-            "*.temp",
-            "*_scratch.*",
-            "debug_*",
-            "test_temp_*",
-            "WIP_*",
-            "*.notes",
-        ]
-
-        for pattern in temp_patterns:
-            files = list(worktree_path.rglob(pattern))
-            # Filter out .git and other excluded dirs
-            files = [f for f in files if not any(part.startswith(".git") for part in f.parts)]
-            if files:
-                violations.append(
-                    f"Temporary files ({pattern}): " + f"{[f.name for f in files[:3]]}"
-                )
+        for pattern, names in temp_hits.items():
+            if names:
+                violations.append(f"Temporary files ({pattern}): " + f"{names[:MAX_EXAMPLES]}")
 
         # Check 2: Uncommitted changes
-        try:
-            result = subprocess.run(
-                ["git", "status", "--porcelain"],
-                cwd=worktree_path,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-
-            if result.stdout.strip():
-                violations.append("Uncommitted changes in worktree")
-        except subprocess.CalledProcessError:
+        if status_error:
             violations.append("Could not check git status")
+        elif has_changes:
+            violations.append("Uncommitted changes in worktree")
 
         # Check 3: Large files (>10MB)
-        large_files = []
-        for file in worktree_path.rglob("*"):
-            if file.is_file() and file.stat().st_size > 10_000_000:
-                large_files.append(file.name)
-
         if large_files:
-            violations.append(f"Large files (>10MB): {large_files[:3]}")
+            violations.append(f"Large files (>10MB): {large_files[:MAX_EXAMPLES]}")
 
         return violations
 
     def list_worktrees(self) -> list[dict]:
         """List all active worktrees using subprocess"""
-        try:
-            result = subprocess.run(
-                ["git", "worktree", "list", "--porcelain"],
-                capture_output=True,
-                text=True,
-                check=True,
-                cwd=self.repo_path,
-            )
-        except subprocess.CalledProcessError:
-            return []
-
         worktrees = []
         current = {}
 
-        for line in result.stdout.splitlines():
-            if line.startswith("worktree "):
-                if current:
-                    worktrees.append(current)
-                current = {"path": line.split(" ", 1)[1]}
-            elif line.startswith("branch "):
-                current["branch"] = line.split(" ", 1)[1]
-            elif line.startswith("HEAD "):
-                current["head"] = line.split(" ", 1)[1]
+        # Parse lines as git emits them rather than buffering the whole output;
+        # only the values we keep get decoded
+        with subprocess.Popen(
+            ["git", "worktree", "list", "--porcelain"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=self.repo_path,
+        ) as proc:
+            for line in proc.stdout:
+                line = line.rstrip(b"\n")
+                if line[:9] == b"worktree ":
+                    if current:
+                        worktrees.append(current)
+                    current = {"path": os.fsdecode(line[9:])}
+                elif line[:7] == b"branch ":
+                    current["branch"] = line[7:].decode()
+                elif line[:5] == b"HEAD ":
+                    current["head"] = line[5:].decode()
+
+        if proc.returncode != 0:
+            return []
 
         if current:
             worktrees.append(current)
@@ -183,7 +431,9 @@ class GitWorktreeManager:
 
         cleaned = []
         worktrees = self.list_worktrees()
+        cutoff = time.time() - ORPHAN_AGE_SECONDS
 
+        candidates = []
         for wt in worktrees:
             path = Path(wt["path"])
 
@@ -196,28 +446,28 @@ class GitWorktreeManager:
                 cleaned.append(str(path))
                 continue
 
-            # Check age (older than 24 hours with no recent activity)
-            try:
-                mtime = path.stat().st_mtime
-                age_hours = (time.time() - mtime) / 3600
+            candidates.append(path)
 
-                if age_hours > 24:
-                    # Check if it's truly abandoned
-                    result = subprocess.run(
-                        ["git", "status", "--porcelain"], cwd=path, capture_output=True, text=True
-                    )
+        if not candidates:
+            return cleaned
 
-                    if result.returncode == 0 and not result.stdout.strip():
-                        # Clean worktree with no changes - remove it
-                        try:
-                            subprocess.run(
-                                ["git", "worktree", "remove", str(path), "--force"],
-                                check=True,
-                                cwd=self.repo_path,
-                            )
-                            cleaned.append(str(path))
-                        except Exception:
-                            pass
+        # Each git status is an independent subprocess, so they run side by side;
+        # removals stay serial since they all update the shared repository
+        workers = min(16, len(candidates))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            abandoned = list(pool.map(_is_abandoned, candidates, [cutoff] * len(candidates)))
+
+        for path, is_abandoned in zip(candidates, abandoned, strict=True):
+            if not is_abandoned:
+                continue
+            # Clean worktree with no changes - remove it
+            try:
+                subprocess.run(
+                    ["git", "worktree", "remove", str(path), "--force"],
+                    check=True,
+                    cwd=self.repo_path,
+                )
+                cleaned.append(str(path))
             except Exception:  # nosec
                 continue
 
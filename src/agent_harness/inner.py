@@ -5,13 +5,26 @@ This provides a simple, stateless agent loop with minimal overhead.
 For users who don't need full SMP compliance, this is the entry point.
 """
 
+import asyncio
+import functools
 import json
+import os
+import selectors
+import signal
+import subprocess
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from agent_harness.security import EscapeDetector, HardenedPrompt, SecurityException, ToolAuditor
 from agent_harness.session_tracker import SessionTracker
 
+# Shared by every harness for blocking tool work, so concurrent tool calls reuse
+# warm threads instead of starting new ones each turn
+_TOOL_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="agent-tool")
+
 
 class Tool(ABC):
     """Base class for inner harness tools."""
@@ -33,6 +46,11 @@ class Tool(ABC):
         """Execute the tool and return result."""
         ...
 
+    async def aexecute(self, **kwargs) -> str:
+        """Execute the tool without blocking the event loop (runs execute() on a thread)."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_TOOL_EXECUTOR, functools.partial(self.execute, **kwargs))
+
 
 class ReadTool(Tool):
     """Read file contents."""
@@ -47,8 +65,9 @@ class ReadTool(Tool):
 
     def execute(self, path: str) -> str:
         try:
-            with open(path) as f:
-                return f.read()
+            # One sized read of the raw bytes; skip TextIOWrapper's chunked decode
+            with open(path, "rb") as f:
+                return f.read().decode("utf-8", "replace")
         except Exception as e:
             return f"Error reading file: {e}"
 
@@ -88,9 +107,11 @@ class EditTool(Tool):
         try:
             with open(path) as f:
                 content = f.read()
-            if old_content not in content:
+            # One scan locates the match; splice around it instead of replace()
+            idx = content.find(old_content)
+            if idx < 0:
                 return f"Error: old_content not found in {path}"
-            content = content.replace(old_content, new_content, 1)
+            content = content[:idx] + new_content + content[idx + len(old_content) :]
             with open(path, "w") as f:
                 f.write(content)
             return f"Successfully edited {path}"
@@ -98,6 +119,27 @@ class EditTool(Tool):
             return f"Error editing file: {e}"
 
 
+_BASH_TIMEOUT_SECONDS = 60
+_BASH_OUTPUT_LIMIT = 4000
+
+# UTF-8 needs at most 4 bytes per character, so this many bytes always covers
+# _BASH_OUTPUT_LIMIT decoded characters
+_OUTPUT_BYTES_CAP = _BASH_OUTPUT_LIMIT * 4
+
+
+def _format_output(output: bytes) -> str:
+    text = output.decode(errors="replace")[:_BASH_OUTPUT_LIMIT]
+    return text if text else "(no output)"
+
+
+def _kill_process_group(proc: Any) -> None:
+    """Kill a shell started in its own session together with anything it spawned."""
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
 class BashTool(Tool):
     """Execute bash commands."""
 
@@ -110,23 +152,90 @@ class BashTool(Tool):
         return "Execute a bash command. Args: command (str)"
 
     def execute(self, command: str) -> str:
-        import subprocess
-
         try:
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 command,
                 shell=True,  # nosec B602
-                capture_output=True,
-                text=True,
-                timeout=60,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                bufsize=0,
+                start_new_session=True,
             )
-            output = result.stdout + result.stderr
-            return output[:4000] if output else "(no output)"
+        except Exception as e:
+            return f"Error executing command: {e}"
+
+        # Stream the output, keeping only what can be returned; anything past the
+        # cap is drained and dropped so a chatty command can't balloon memory
+        output = bytearray()
+        deadline = time.monotonic() + _BASH_TIMEOUT_SECONDS
+        fd = proc.stdout.fileno()
+        try:
+            with selectors.DefaultSelector() as selector:
+                selector.register(fd, selectors.EVENT_READ)
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise subprocess.TimeoutExpired(command, _BASH_TIMEOUT_SECONDS)
+                    if not selector.select(remaining):
+                        continue
+                    chunk = os.read(fd, 4096)
+                    if not chunk:
+                        break
+                    if len(output) < _OUTPUT_BYTES_CAP:
+                        output += chunk
+            proc.wait(timeout=max(deadline - time.monotonic(), 0))
         except subprocess.TimeoutExpired:
-            return "Error: command timed out after 60 seconds"
+            _kill_process_group(proc)
+            proc.wait()
+            return f"Error: command timed out after {_BASH_TIMEOUT_SECONDS} seconds"
+        except Exception as e:
+            _kill_process_group(proc)
+            proc.wait()
+            return f"Error executing command: {e}"
+        finally:
+            proc.stdout.close()
+
+        return _format_output(output)
+
+    async def aexecute(self, command: str) -> str:
+        try:
+            proc = await asyncio.create_subprocess_shell(
+                command,  # nosec B604
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                start_new_session=True,
+            )
         except Exception as e:
             return f"Error executing command: {e}"
 
+        output = bytearray()
+
+        async def drain() -> None:
+            while chunk := await proc.stdout.read(4096):
+                if len(output) < _OUTPUT_BYTES_CAP:
+                    output.extend(chunk)
+            await proc.wait()
+
+        try:
+            await asyncio.wait_for(drain(), timeout=_BASH_TIMEOUT_SECONDS)
+        # asyncio.TimeoutError only became the builtin TimeoutError in 3.11
+        except (TimeoutError, asyncio.TimeoutError):  # noqa: UP041
+            _kill_process_group(proc)
+            await proc.wait()
+            return f"Error: command timed out after {_BASH_TIMEOUT_SECONDS} seconds"
+        except asyncio.CancelledError:
+            # The shell runs in its own session, so cancelling this task alone
+            # would leave it (and its children) running
+            _kill_process_group(proc)
+            await proc.wait()
+            raise
+        except Exception as e:
+            _kill_process_group(proc)
+            await proc.wait()
+            return f"Error executing command: {e}"
+
+        return _format_output(output)
+
 
 DEFAULT_SYSTEM_PROMPT = """You are a helpful coding assistant. You have access to tools for reading, writing, and editing files, as well as executing bash commands.
 
@@ -175,9 +284,19 @@ class InnerHarness:
         """
         self.llm = llm_client
         self.tools = {t.name: t for t in (tools or self.CORE_TOOLS)}
+        # Bound methods looked up once, so dispatch is a single dict access per call
+        self._tool_fns = {name: tool.execute for name, tool in self.tools.items()}
+        self._tool_afns = {name: tool.aexecute for name, tool in self.tools.items()}
+        # Tools are fixed for the harness's lifetime, so the schema is built once
+        self._tools_schema = self._build_tools_schema()
 
         base_prompt = system_prompt or DEFAULT_SYSTEM_PROMPT
-        self.system_prompt = HardenedPrompt.build(base_prompt) if hardened else base_prompt
+        if not hardened:
+            self.system_prompt = base_prompt
+        elif base_prompt is DEFAULT_SYSTEM_PROMPT:
+            self.system_prompt = HARDENED_SYSTEM_PROMPT
+        else:
+            self.system_prompt = HardenedPrompt.build(base_prompt)
 
         self.auditor = ToolAuditor() if hardened else None
         self.detector = EscapeDetector() if hardened else None
@@ -202,10 +321,13 @@ class InnerHarness:
             for tool in self.tools.values()
         ]
 
-    def _execute_tool(self, tool_call: Any) -> str:
-        """Execute a tool call and return the result."""
+    def _resolve_tool_call(
+        self, tool_call: Any, fns: dict[str, Callable[..., Any]]
+    ) -> tuple[str, Callable[..., Any], dict] | str:
+        """Look up the tool function and decode its arguments, or return an error message."""
         tool_name = tool_call.function.name
-        if tool_name not in self.tools:
+        fn = fns.get(tool_name)
+        if fn is None:
             return f"Unknown tool: {tool_name}"
 
         try:
@@ -213,8 +335,10 @@ class InnerHarness:
         except json.JSONDecodeError:
             return f"Invalid tool arguments: {tool_call.function.arguments}"
 
-        result = self.tools[tool_name].execute(**args)
+        return tool_name, fn, args
 
+    def _audit(self, tool_name: str, args: dict, result: str) -> str:
+        """Record a finished tool call with the auditor, if hardening is enabled."""
         if self.auditor:
             if not self.tracker.has_active_session():
                 raise SecurityException("No active harness session detected during tool execution.")
@@ -222,6 +346,50 @@ class InnerHarness:
 
         return result
 
+    def _execute_tool(self, tool_call: Any) -> str:
+        """Execute a tool call and return the result."""
+        resolved = self._resolve_tool_call(tool_call, self._tool_fns)
+        if isinstance(resolved, str):
+            return resolved
+
+        tool_name, fn, args = resolved
+        return self._audit(tool_name, args, fn(**args))
+
+    async def _aexecute_tool(self, tool_call: Any) -> str:
+        """Async counterpart of _execute_tool."""
+        resolved = self._resolve_tool_call(tool_call, self._tool_afns)
+        if isinstance(resolved, str):
+            return resolved
+
+        tool_name, afn, args = resolved
+        return self._audit(tool_name, args, await afn(**args))
+
+    def _execute_tool_calls(self, tool_calls: list[Any]) -> list[str]:
+        """
+        Execute every tool call from one LLM turn, concurrently when there are
+        several. Results are returned in the order the calls were made.
+
+        Hardened harnesses run the calls one at a time: the auditor checks each
+        call as it finishes, and a violation must stop the calls after it.
+        """
+        if len(tool_calls) == 1 or self.auditor:
+            return [self._execute_tool(tc) for tc in tool_calls]
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            # Already inside an event loop (e.g. called from async code), so one
+            # can't be started here: fan the calls out to the tool threads instead
+            futures = [_TOOL_EXECUTOR.submit(self._execute_tool, tc) for tc in tool_calls]
+            return [future.result() for future in futures]
+
+        async def gather() -> list[str]:
+            return await asyncio.gather(*(self._aexecute_tool(tc) for tc in tool_calls))
+
+        return asyncio.run(gather())
+
     def run(self, user_message: str, max_iterations: int = 50) -> str:
         """
         Run the simple agent loop until LLM stops requesting tools.
@@ -247,7 +415,7 @@ class InnerHarness:
             try:
                 response = self.llm.invoke(
                     messages,
-                    tools=self._build_tools_schema(),
+                    tools=self._tools_schema,
                 )
             except SecurityException as e:
                 return f"Security Violation: {e}"
@@ -271,13 +439,13 @@ class InnerHarness:
                 }
             )
 
-            # Execute each tool and add results
-            for tool_call in response.tool_calls:
-                try:
-                    result = self._execute_tool(tool_call)
-                except SecurityException as e:
-                    return f"Security Violation: {e}"
+            # Execute the tools and add results
+            try:
+                results = self._execute_tool_calls(response.tool_calls)
+            except SecurityException as e:
+                return f"Security Violation: {e}"
 
+            for tool_call, result in zip(response.tool_calls, results, strict=True):
                 messages.append(
                     {
                         "role": "tool",
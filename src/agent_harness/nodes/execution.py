@@ -1,3 +1,4 @@
+import sys
 from datetime import datetime
 
 from agent_harness.agents.sisyphus import sisyphus_orchestrator
@@ -8,7 +9,9 @@ def execution_node(state: ProtocolState) -> ProtocolState:
     """
     Execution node delegating to the Sisyphus team.
     """
-    return sisyphus_orchestrator(state)
+    # Execution changes the working tree, so a git snapshot taken before it must
+    # not be reused by the checklist phases that follow
+    return {**sisyphus_orchestrator(state), "git_fingerprint": None}
 
 
 def human_approval_node(state: ProtocolState) -> ProtocolState:
@@ -16,11 +19,11 @@ def human_approval_node(state: ProtocolState) -> ProtocolState:
     Node that explicitly requests human approval.
     LangGraph will interrupt BEFORE this node.
     """
-    print(f"✋ Awaiting manual approval for {state['process_id']}")
+    # Status goes to stderr so it never mixes with output piped from stdout
+    sys.stderr.write(f"✋ Awaiting manual approval for {state['process_id']}\n")
 
     # Once continued, we assume approved (or user edited state)
     return {
-        **state,
         "awaiting_approval": False,
         "current_phase": "APPROVED",
         "last_updated": datetime.now().isoformat(),
@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 
@@ -25,12 +26,41 @@ from agent_harness.compliance import (
     check_wrapup_exclusivity,
     check_wrapup_indicator_symmetry,
     inject_debrief_to_beads,
+    invalidate_command_cache,
     validate_atomic_commits,
     validate_tdd_compliance,
 )
+from agent_harness.git_snapshot import (
+    git_snapshot_pass,
+    snapshot_fingerprint,
+    snapshot_from_fingerprint,
+)
 from agent_harness.state import ProtocolState
 
 
+def _finalization_validators() -> dict[str, Callable]:
+    # Built per call rather than frozen at import so validators patched on this
+    # module are the ones that run
+    return {
+        "check_git_status": check_git_status,
+        "validate_atomic_commits": validate_atomic_commits,
+        "validate_tdd_compliance": validate_tdd_compliance,
+        "check_reflection_invoked": check_reflection_invoked,
+        "check_handoff_compliance": check_handoff_compliance,
+        "check_handoff_beads_id": check_handoff_beads_id,
+        "check_beads_pr_sync": check_beads_pr_sync,
+        "check_no_separate_review_issues": check_no_separate_review_issues,
+        "check_pr_exists": check_pr_exists,
+        "check_todo_completion": check_todo_completion,
+        "check_pr_decomposition_closure": check_pr_decomposition_closure,
+        "check_child_pr_linkage": check_child_pr_linkage,
+        "check_workspace_cleanup": check_workspace_cleanup,
+        "check_handoff_pr_verification": check_handoff_pr_verification,
+        "check_issue_closure_gate": check_issue_closure_gate,
+        "check_readme_needs_update": check_readme_needs_update,
+    }
+
+
 def finalization_node(state: ProtocolState) -> ProtocolState:
     """
     Node for performing the Finalization checks using JSON checklists.
@@ -39,47 +69,56 @@ def finalization_node(state: ProtocolState) -> ProtocolState:
     checklist_dir = project_root / ".agent/rules/checklists"
 
     manager = ChecklistManager(checklist_dir)
+    manager.register_validators(_finalization_validators())
+
+    # bd/gh queries are memoized within a pass; start each pass from fresh state
+    invalidate_command_cache()
+
+    # Run finalization phase; validators share one git status/branch read instead of
+    # each spawning git, reusing the one in the state if it is only seconds old
+    reused = snapshot_from_fingerprint(state.get("git_fingerprint"))
+    with git_snapshot_pass(reused) as snapshot:
+        # The outcome is pass/blocked, so stop at the first blocker instead of
+        # spending subprocess calls on checks that can't change it
+        passed, blockers, warnings = manager.run_phase("finalization", fail_fast=True)
 
-    # Register validators
-    manager.register_validator("check_git_status", check_git_status)
-    manager.register_validator("validate_atomic_commits", validate_atomic_commits)
-    manager.register_validator("validate_tdd_compliance", validate_tdd_compliance)
-    manager.register_validator("check_reflection_invoked", check_reflection_invoked)
-    manager.register_validator("check_handoff_compliance", check_handoff_compliance)
-    manager.register_validator("check_handoff_beads_id", check_handoff_beads_id)
-    manager.register_validator("check_beads_pr_sync", check_beads_pr_sync)
-    manager.register_validator("check_no_separate_review_issues", check_no_separate_review_issues)
-    manager.register_validator("check_pr_exists", check_pr_exists)
-    manager.register_validator("check_todo_completion", check_todo_completion)
-    manager.register_validator("check_pr_decomposition_closure", check_pr_decomposition_closure)
-    manager.register_validator("check_child_pr_linkage", check_child_pr_linkage)
-    manager.register_validator("check_workspace_cleanup", check_workspace_cleanup)
-    manager.register_validator("check_handoff_pr_verification", check_handoff_pr_verification)
-    manager.register_validator("check_issue_closure_gate", check_issue_closure_gate)
-    manager.register_validator("check_readme_needs_update", check_readme_needs_update)
-
-    # Run finalization phase
-    passed, blockers, warnings = manager.run_phase("finalization")
-
-    # Add step to progress
+    # Add step to progress, stamped with the same time as last_updated
+    now = datetime.now().isoformat()
     step = {
         "index": state["current_step_index"],
         "task_id": "Finalization",
         "action": "Run JSON-based Finalization Check",
         "outcome": f"Passed: {passed}. Blockers: {len(blockers)}, Warnings: {len(warnings)}",
         "status": "success" if passed else "failure",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now,
     }
 
     return {
-        **state,
         "finalization_passed": passed,
         "blockers": blockers,
         "warnings": warnings,
         "current_phase": "Retrospective" if passed else "FINALIZATION_BLOCKED",
-        "steps_completed": state.get("steps_completed", []) + [step],
+        "steps_completed": [step],
         "current_step_index": state["current_step_index"] + 1,
-        "last_updated": datetime.now().isoformat(),
+        "last_updated": now,
+        "git_fingerprint": (
+            state.get("git_fingerprint") if reused else snapshot_fingerprint(snapshot)
+        ),
+    }
+
+
+def _retrospective_validators() -> dict[str, Callable]:
+    return {
+        "check_reflection_invoked": check_reflection_invoked,
+        "check_debriefing_invoked": check_debriefing_invoked,
+        "check_plan_approval": check_plan_approval,
+        "check_progress_log_exists": check_progress_log_exists,
+        "check_handoff_pr_link": check_handoff_pr_link,
+        "check_handoff_beads_id": check_handoff_beads_id,
+        "check_todo_completion": check_todo_completion,
+        "check_wrapup_indicator_symmetry": check_wrapup_indicator_symmetry,
+        "check_wrapup_exclusivity": check_wrapup_exclusivity,
+        "check_protocol_compliance_reporting": check_protocol_compliance_reporting,
     }
 
 
@@ -91,42 +130,41 @@ def retrospective_node(state: ProtocolState) -> ProtocolState:
     checklist_dir = project_root / ".agent/rules/checklists"
 
     manager = ChecklistManager(checklist_dir)
+    manager.register_validators(_retrospective_validators())
+    # Posts the debrief to the issue, so it must only run once the phase is clear
+    manager.register_validator("inject_debrief_to_beads", inject_debrief_to_beads, mutating=True)
+
+    # bd/gh queries are memoized within a pass; start each pass from fresh state
+    invalidate_command_cache()
+
+    # Run retrospective phase. It usually follows finalization directly, so the
+    # git read finalization left in the state is still fresh
+    reused = snapshot_from_fingerprint(state.get("git_fingerprint"))
+    with git_snapshot_pass(reused) as snapshot:
+        # The outcome is pass/blocked, so stop at the first blocker instead of
+        # spending subprocess calls on checks that can't change it
+        passed, blockers, warnings = manager.run_phase("retrospective", fail_fast=True)
 
-    # Register validators
-    manager.register_validator("check_reflection_invoked", check_reflection_invoked)
-    manager.register_validator("check_debriefing_invoked", check_debriefing_invoked)
-    manager.register_validator("check_plan_approval", check_plan_approval)
-    manager.register_validator("check_progress_log_exists", check_progress_log_exists)
-    manager.register_validator("check_handoff_pr_link", check_handoff_pr_link)
-    manager.register_validator("check_handoff_beads_id", check_handoff_beads_id)
-    manager.register_validator("check_todo_completion", check_todo_completion)
-    manager.register_validator("check_wrapup_indicator_symmetry", check_wrapup_indicator_symmetry)
-    manager.register_validator("check_wrapup_exclusivity", check_wrapup_exclusivity)
-    manager.register_validator("inject_debrief_to_beads", inject_debrief_to_beads)
-    manager.register_validator(
-        "check_protocol_compliance_reporting", check_protocol_compliance_reporting
-    )
-
-    # Run retrospective phase
-    passed, blockers, warnings = manager.run_phase("retrospective")
-
-    # Add step to progress
+    # Add step to progress, stamped with the same time as last_updated
+    now = datetime.now().isoformat()
     step = {
         "index": state["current_step_index"],
         "task_id": "Retrospective",
         "action": "Run JSON-based Retrospective Check",
         "outcome": f"Passed: {passed}. Blockers: {len(blockers)}, Warnings: {len(warnings)}",
         "status": "success" if passed else "failure",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now,
     }
 
     return {
-        **state,
         "retrospective_passed": passed,
         "blockers": blockers,
         "warnings": warnings,
         "current_phase": "COMPLETE" if passed else "RETROSPECTIVE_BLOCKED",
-        "steps_completed": state.get("steps_completed", []) + [step],
+        "steps_completed": [step],
         "current_step_index": state["current_step_index"] + 1,
-        "last_updated": datetime.now().isoformat(),
+        "last_updated": now,
+        "git_fingerprint": (
+            state.get("git_fingerprint") if reused else snapshot_fingerprint(snapshot)
+        ),
     }
@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 
@@ -15,10 +16,35 @@ from agent_harness.compliance import (
     check_sop_simplification,
     check_tool_version,
     check_workspace_integrity,
+    invalidate_command_cache,
+)
+from agent_harness.git_snapshot import (
+    git_snapshot_pass,
+    snapshot_fingerprint,
+    snapshot_from_fingerprint,
 )
 from agent_harness.state import ProtocolState
 
 
+def _initialization_validators() -> dict[str, Callable]:
+    # Built per call rather than frozen at import so validators patched on this
+    # module are the ones that run
+    return {
+        "check_tool_version": check_tool_version,
+        "check_workspace_integrity": check_workspace_integrity,
+        "check_planning_docs": check_planning_docs,
+        "check_beads_issue": check_beads_issue,
+        "check_plan_approval": check_plan_approval,
+        "check_harness_session": check_harness_session,
+        "check_hook_integrity": check_hook_integrity,
+        "check_branch_issue_coupling": check_branch_issue_coupling,
+        "check_sop_simplification": check_sop_simplification,
+        "check_progress_log_exists": check_progress_log_exists,
+        "check_rebase_status": check_rebase_status,
+        "check_closed_issue_branches": check_closed_issue_branches,
+    }
+
+
 def initialization_node(state: ProtocolState) -> ProtocolState:
     """
     Node for performing the Initialization check using JSON checklists.
@@ -27,41 +53,37 @@ def initialization_node(state: ProtocolState) -> ProtocolState:
     checklist_dir = project_root / ".agent/rules/checklists"
 
     manager = ChecklistManager(checklist_dir)
+    manager.register_validators(_initialization_validators())
 
-    # Register validators
-    manager.register_validator("check_tool_version", check_tool_version)
-    manager.register_validator("check_workspace_integrity", check_workspace_integrity)
-    manager.register_validator("check_planning_docs", check_planning_docs)
-    manager.register_validator("check_beads_issue", check_beads_issue)
-    manager.register_validator("check_plan_approval", check_plan_approval)
-    manager.register_validator("check_harness_session", check_harness_session)
-    manager.register_validator("check_hook_integrity", check_hook_integrity)
-    manager.register_validator("check_branch_issue_coupling", check_branch_issue_coupling)
-    manager.register_validator("check_sop_simplification", check_sop_simplification)
-    manager.register_validator("check_progress_log_exists", check_progress_log_exists)
-    manager.register_validator("check_rebase_status", check_rebase_status)
-    manager.register_validator("check_closed_issue_branches", check_closed_issue_branches)
+    # bd/gh queries are memoized within a pass; start each pass from fresh state
+    invalidate_command_cache()
 
-    # Run initialization phase
-    passed, blockers, warnings = manager.run_phase("initialization")
+    # Run initialization phase; validators share one git status/branch read instead of
+    # each spawning git, reusing the one in the state if it is only seconds old
+    reused = snapshot_from_fingerprint(state.get("git_fingerprint"))
+    with git_snapshot_pass(reused) as snapshot:
+        passed, blockers, warnings = manager.run_phase("initialization")
 
-    # Add step to progress
+    # Add step to progress, stamped with the same time as last_updated
+    now = datetime.now().isoformat()
     step = {
         "index": state["current_step_index"],
         "task_id": "Initialization",
         "action": "Run JSON-based Initialization Check",
         "outcome": f"Passed: {passed}. Blockers: {len(blockers)}, Warnings: {len(warnings)}",
         "status": "success" if passed else "failure",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now,
     }
 
     return {
-        **state,
         "initialization_passed": passed,
         "blockers": blockers,
         "warnings": warnings,
         "current_phase": "Execution" if passed else "BLOCKED",
-        "steps_completed": state.get("steps_completed", []) + [step],
+        "steps_completed": [step],
         "current_step_index": state["current_step_index"] + 1,
-        "last_updated": datetime.now().isoformat(),
+        "last_updated": now,
+        "git_fingerprint": (
+            state.get("git_fingerprint") if reused else snapshot_fingerprint(snapshot)
+        ),
     }
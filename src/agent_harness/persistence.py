@@ -8,6 +8,16 @@ from langgraph.checkpoint.sqlite import SqliteSaver
 DB_DIR = Path(".harness/data")
 DB_PATH = DB_DIR / "harness_state.db"
 
+# Checkpointing is many small write transactions: WAL keeps readers from blocking
+# the writer, and NORMAL sync is durable under WAL except on power loss.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
 
 def ensure_db_directory():
     """Create DB directory if it doesn't exist."""
@@ -22,4 +32,6 @@ def get_sqlite_checkpointer(db_path: str | None = None):
         ensure_db_directory()
         db_path = str(DB_PATH)
     conn = sqlite3.connect(db_path, check_same_thread=False)
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
     return SqliteSaver(conn)
@@ -1,6 +1,7 @@
-import json
 from pathlib import Path
 
+from agent_harness import _json
+
 
 def generate_checklist_md():
     checklist_dir = Path(".agent/rules/checklists")
@@ -10,9 +11,12 @@ def generate_checklist_md():
         print(f"Error: {checklist_dir} not found")
         return
 
-    md_content = "# 📋 Standard Operating Procedure (SOP) Compliance Checklist (Generated)\n\n"
-    md_content += "> **Source of Truth**: The JSON files in `.agent/rules/checklists/` define the authoritative workflow.\n\n"
-    md_content += "## ⚡ Phases\n\n"
+    # Collected as parts and joined once, rather than re-copying a growing string
+    parts = [
+        "# 📋 Standard Operating Procedure (SOP) Compliance Checklist (Generated)\n\n",
+        "> **Source of Truth**: The JSON files in `.agent/rules/checklists/` define the authoritative workflow.\n\n",
+        "## ⚡ Phases\n\n",
+    ]
 
     phases = [
         "initialization",
@@ -28,25 +32,24 @@ def generate_checklist_md():
         if not json_path.exists():
             continue
 
-        with open(json_path) as f:
-            data = json.load(f)
-            if "phases" in data and data["phases"]:
-                phase = data["phases"][0]
-                md_content += f"### {phase['name']} — {phase['status']}\n\n"
-                if phase.get("description"):
-                    md_content += f"{phase['description']}\n\n"
+        data = _json.loads(json_path.read_bytes())
+        if "phases" in data and data["phases"]:
+            phase = data["phases"][0]
+            parts.append(f"### {phase['name']} — {phase['status']}\n\n")
+            if phase.get("description"):
+                parts.append(f"{phase['description']}\n\n")
 
-                for check in phase.get("checks", []):
-                    md_content += (
-                        f"- [ ] **{check['description']}** (Validator: `{check['validator']}`)\n"
-                    )
-                md_content += "\n"
+            parts.extend(
+                f"- [ ] **{check['description']}** (Validator: `{check['validator']}`)\n"
+                for check in phase.get("checks", [])
+            )
+            parts.append("\n")
 
     # Create directory if it doesn't exist
     output_file.parent.mkdir(parents=True, exist_ok=True)
 
     with open(output_file, "w") as f:
-        f.write(md_content)
+        f.write("".join(parts))
 
     print(f"Successfully generated {output_file}")
 
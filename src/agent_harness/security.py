@@ -41,19 +41,33 @@ Before taking ANY action, verify:
 === END REMINDER ===
 """
 
+    # The sandwich around the base prompt never changes, so it is joined once
+    _PREFIX = f"{CRITICAL_CONSTRAINTS}\n{SECURITY_NOTICE}\n\n"
+    _SUFFIX = f"\n\n{CRITICAL_CONSTRAINTS}\n{VERIFICATION_REMINDER}\n"
+
     @classmethod
     def build(cls, base_prompt: str) -> str:
         """
         Construct a hardened prompt by sandwiching the base prompt between constraints.
         """
-        return f"""{cls.CRITICAL_CONSTRAINTS}
-{cls.SECURITY_NOTICE}
+        return cls._PREFIX + base_prompt + cls._SUFFIX
 
-{base_prompt}
 
-{cls.CRITICAL_CONSTRAINTS}
-{cls.VERIFICATION_REMINDER}
-"""
+# Path fragments a tool call should never touch (simplified for demo)
+SENSITIVE_PATHS = ("/etc/",)
+
+_SENSITIVE_RE = re.compile("|".join(re.escape(p) for p in SENSITIVE_PATHS))
+
+
+def _mentions_sensitive_path(value: Any) -> bool:
+    """Whether any string inside a tool's (JSON-decoded) arguments names a sensitive path."""
+    if isinstance(value, str):
+        return _SENSITIVE_RE.search(value) is not None
+    if isinstance(value, dict):
+        return any(_mentions_sensitive_path(v) for v in value.values())
+    if isinstance(value, list | tuple):
+        return any(_mentions_sensitive_path(v) for v in value)
+    return False
 
 
 class ToolAuditor:
@@ -65,14 +79,19 @@ class ToolAuditor:
         self.call_history: list[dict] = []
         self.max_bash_calls = max_bash_calls
         self.max_total_calls = max_total_calls
-        self.suspicious_patterns = [
+        # Running totals, so each call is checked without rescanning the history
+        self._tool_counts: dict[str, int] = {}
+        self._sensitive_access = False
+
+    def _is_suspicious(self) -> bool:
+        return (
             # Pattern: Trying to read sensitive system files (simplified for demo)
-            lambda calls: any("/etc/" in str(c.get("args", {})) for c in calls),
+            self._sensitive_access
             # Pattern: Excessive bash calls
-            lambda calls: len([c for c in calls if c["tool"] == "bash"]) > self.max_bash_calls,
+            or self._tool_counts.get("bash", 0) > self.max_bash_calls
             # Pattern: Total call limit
-            lambda calls: len(calls) > self.max_total_calls,
-        ]
+            or len(self.call_history) > self.max_total_calls
+        )
 
     def log_call(self, tool_name: str, args: dict, result: Any):
         """Log a tool call and check for anomalies."""
@@ -84,19 +103,16 @@ class ToolAuditor:
                 "status": "success" if "error" not in str(result).lower() else "failure",
             }
         )
+        self._tool_counts[tool_name] = self._tool_counts.get(tool_name, 0) + 1
+        if not self._sensitive_access and _mentions_sensitive_path(args):
+            self._sensitive_access = True
 
-        # Check for suspicious patterns in the recent history
-        for pattern in self.suspicious_patterns:
-            if pattern(self.call_history):
-                raise SecurityException(f"Suspicious tool usage detected: {tool_name} with {args}")
+        if self._is_suspicious():
+            raise SecurityException(f"Suspicious tool usage detected: {tool_name} with {args}")
 
     def get_stats(self) -> dict:
         """Return summary of tool usage."""
-        stats = {"total_calls": len(self.call_history), "tool_counts": {}}
-        for call in self.call_history:
-            name = call["tool"]
-            stats["tool_counts"][name] = stats["tool_counts"].get(name, 0) + 1
-        return stats
+        return {"total_calls": len(self.call_history), "tool_counts": dict(self._tool_counts)}
 
 
 class EscapeDetector:
@@ -118,16 +134,18 @@ class EscapeDetector:
         r"(instead of using|without using) (tools|the .* tool)",
     ]
 
+    # All patterns folded into one regex: almost every message matches none of
+    # them, and those are cleared in a single pass over the text
+    _ANY_ESCAPE = re.compile("|".join(f"(?:{p})" for p in ESCAPE_PATTERNS))
+    _COMPILED = tuple((p, re.compile(p).search) for p in ESCAPE_PATTERNS)
+
     def check_text(self, text: str) -> list[str]:
         """Check text for escape attempts and return list of detected patterns."""
-        detected = []
         text_lower = text.lower()
+        if not self._ANY_ESCAPE.search(text_lower):
+            return []
 
-        for pattern in self.ESCAPE_PATTERNS:
-            if re.search(pattern, text_lower):
-                detected.append(pattern)
-
-        return detected
+        return [pattern for pattern, search in self._COMPILED if search(text_lower)]
 
 
 class SecurityException(Exception):
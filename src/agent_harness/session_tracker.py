@@ -1,13 +1,111 @@
 import argparse
-import json
+import atexit
+import fnmatch
 import os
+import re
+import shutil
+import stat
 import sys
+import tempfile
+import threading
 import time
 from dataclasses import dataclass
-from functools import wraps
+from functools import cached_property, wraps
 from pathlib import Path
 from typing import Any
 
+from agent_harness import _json
+
+# Set in CI/test environments, where session-end cleanup validation is skipped
+_SKIP_CLEANUP_ENV = ("RUNNING_IN_CI", "CI", "HARNESS_SKIP_CLEANUP", "PYTEST_CURRENT_TEST")
+
+# Never scanned for cleanup violations, along with anything named .git*
+_SCAN_EXCLUDED_NAMES = frozenset({"venv", ".venv", "node_modules", "__pycache__"})
+
+
+def _matches_tail(parts: tuple[str, ...], pattern: tuple[str, ...]) -> bool:
+    """Whether the last components of a path match a `/`-split glob pattern."""
+    if len(pattern) > len(parts):
+        return False
+    tail = parts[len(parts) - len(pattern) :]
+    return all(fnmatch.fnmatchcase(part, pat) for part, pat in zip(tail, pattern, strict=True))
+
+
+def _atomic_write_json(path: Path, data: dict) -> None:
+    """Write `data` as JSON via a temp file and rename, so readers never see a partial file.
+
+    The temp file gets a unique name, so concurrent writers never share one.
+    """
+    tmp: str | None = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent, prefix=path.name + ".", suffix=".tmp", delete=False
+        ) as f:
+            tmp = f.name
+            f.write(_json.dumps(data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if tmp is not None:
+            Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+# Append-mode descriptors for session logs, by absolute path: (pid, fd, (st_dev, st_ino))
+_log_fds: dict[str, tuple[int, int, tuple[int, int]]] = {}
+_log_fds_lock = threading.Lock()
+
+
+def _append_line(path: Path, line: bytes) -> None:
+    """Append `line` to `path` through a descriptor kept open for the process.
+
+    Each write is a single unbuffered os.write on an O_APPEND descriptor. The
+    descriptor is reopened after a fork or if the file was removed or replaced.
+    """
+    key = os.path.abspath(path)
+    data = line + b"\n"
+    with _log_fds_lock:
+        cached = _log_fds.get(key)
+        if cached is not None:
+            try:
+                st = os.stat(key)
+                current = (st.st_dev, st.st_ino)
+            except OSError:
+                current = None
+            if cached[0] != os.getpid() or cached[2] != current:
+                if cached[0] == os.getpid():
+                    os.close(cached[1])
+                cached = None
+        if cached is None:
+            fd = os.open(key, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            st = os.fstat(fd)
+            cached = _log_fds[key] = (os.getpid(), fd, (st.st_dev, st.st_ino))
+        os.write(cached[1], data)
+
+
+@atexit.register
+def _close_log_fds() -> None:
+    with _log_fds_lock:
+        for pid, fd, _ in _log_fds.values():
+            if pid == os.getpid():
+                os.close(fd)
+        _log_fds.clear()
+
+
+def _parse_session(raw: bytes) -> dict | None:
+    """The session dict encoded in a lock file's bytes, or None if it is not one."""
+    try:
+        session = _json.loads(raw)
+    except ValueError:
+        return None
+    return session if isinstance(session, dict) else None
+
+
+# Session-start violations are only shown to the user (the first ten of them), so
+# the scan can stop well before walking a large tree in full
+SESSION_START_SCAN_LIMIT = 25
+
 
 def get_cleanup_args() -> argparse.Namespace:
     """Parse command-line arguments for cleanup scripts."""
@@ -45,6 +143,7 @@ class ValidationResult:
     passed: bool
     violations: list[str]
     enforcement_level: str  # 'none', 'warning', 'blocking'
+    truncated: bool = False  # the scan stopped early; there are more violations
 
 
 class CleanupViolationError(Exception):
@@ -57,19 +156,35 @@ class SessionTracker:
     """Track agent sessions and enforce compliance."""
 
     # Use a hidden directory in the home folder for cross-project session tracking if needed,
-    # but for now, we'll use a project-local .agent/session directory.
-    SESSION_DIR = Path.cwd() / ".agent" / "sessions"
-    SESSION_FILE = SESSION_DIR / "session.lock"
-    SESSION_LOG = SESSION_DIR / "sessions.jsonl"
+    # but for now, we'll use a project-local .agent/session directory. It is resolved
+    # against the working directory when first used, not when this module is imported,
+    # so tools that chdir into the project after importing it still find it.
+    # Set SESSION_DIR_OVERRIDE on the class to pin a different directory.
+    SESSION_DIR_OVERRIDE: Path | None = None
 
     def __init__(self):
-        self.SESSION_DIR.mkdir(parents=True, exist_ok=True)
+        # The environment doesn't change over a tracker's lifetime; read it once
+        self._skip_cleanup_validation = any(os.environ.get(var) for var in _SKIP_CLEANUP_ENV)
+
+    @cached_property
+    def session_dir(self) -> Path:
+        session_dir = self.SESSION_DIR_OVERRIDE or Path(os.getcwd()) / ".agent" / "sessions"
+        session_dir.mkdir(parents=True, exist_ok=True)
+        return session_dir
+
+    @property
+    def session_file(self) -> Path:
+        return self.session_dir / "session.lock"
+
+    @property
+    def session_log(self) -> Path:
+        return self.session_dir / "sessions.jsonl"
 
     def init_session(self, mode: str, issue_id: str) -> str:
         """Initialize a new session."""
-        if self.has_active_session():
-            session = self.get_session()
-            if session and session.get("issue_id") == issue_id:
+        session = self.get_session()
+        if session is not None:
+            if session.get("issue_id") == issue_id:
                 return session["id"]
             raise Exception(
                 f"Active session for issue {session.get('issue_id')} already exists. "
@@ -85,42 +200,55 @@ class SessionTracker:
             "status": "active",
         }
 
-        self.SESSION_FILE.write_text(json.dumps(session_data))
+        _atomic_write_json(self.session_file, session_data)
 
         # Log session start
-        with open(self.SESSION_LOG, "a") as f:
-            f.write(json.dumps({**session_data, "event": "session_started"}) + "\n")
+        _append_line(self.session_log, _json.dumps({**session_data, "event": "session_started"}))
 
         return session_id
 
-    def has_active_session(self) -> bool:
-        """Check if active session exists and is not expired (8h)."""
-        if not self.SESSION_FILE.exists():
-            return False
+    def _read_session_unchecked(self) -> dict | None:
+        """Read and parse the session lock, or None if it is missing or invalid.
 
+        An unparsable lock is left in place: other writers (e.g. the orchestrator)
+        don't write it atomically, so it may just be caught mid-write.
+        `close_session` is what removes it.
+        """
         try:
-            session = json.loads(self.SESSION_FILE.read_text())
-            # Check expiration (8 hours)
-            if time.time() - session["started_at"] > 8 * 3600:
-                self.close_session(status="expired")
-                return False
-            return session.get("status") == "active"
-        except Exception:
-            return False
+            raw = self.session_file.read_bytes()
+        except OSError:
+            return None
+        return _parse_session(raw)
+
+    def has_active_session(self) -> bool:
+        """Check if active session exists and is not expired (8h)."""
+        return self.get_session() is not None
 
     def get_session(self) -> dict | None:
-        """Get current session data."""
-        if not self.has_active_session():
+        """Get current session data, if the session is active and not expired."""
+        session = self._read_session_unchecked()
+        if session is None:
             return None
+
         try:
-            return json.loads(self.SESSION_FILE.read_text())
-        except Exception:
+            expired = time.time() - session["started_at"] > 8 * 3600
+        except (KeyError, TypeError):
+            return None
+        if expired:
+            # Check expiration (8 hours); an expired session is closed as is rather
+            # than blocked on workspace cleanup
+            self.close_session(status="expired", validate_cleanup=False)
             return None
+        return session if session.get("status") == "active" else None
 
     def close_session(self, status: str = "completed", validate_cleanup: bool = True):
         """Close the current session with optional cleanup validation."""
-        if not self.SESSION_FILE.exists():
+        # One read tells both whether there is a lock to close and what it holds
+        try:
+            raw = self.session_file.read_bytes()
+        except FileNotFoundError:
             return
+        session = _parse_session(raw)
 
         if validate_cleanup:
             validation = self.validate_finalization()
@@ -130,32 +258,44 @@ class SessionTracker:
                     + "\n".join(f"  - {v}" for v in validation.violations)
                 )
 
-        try:
-            session = json.loads(self.SESSION_FILE.read_text())
-            session["status"] = status
-            session["ended_at"] = time.time()
+        if session is not None:
+            try:
+                session["status"] = status
+                session["ended_at"] = time.time()
 
-            # Log session end
-            with open(self.SESSION_LOG, "a") as f:
-                f.write(json.dumps({**session, "event": "session_ended"}) + "\n")
-        except Exception:
-            pass
+                # Log session end
+                _append_line(self.session_log, _json.dumps({**session, "event": "session_ended"}))
+            except OSError:
+                pass
 
-        self.SESSION_FILE.unlink(missing_ok=True)
+        self.session_file.unlink(missing_ok=True)
 
     # Cleanup validation methods
     PATTERNS_FILE = Path(".harness/cleanup_patterns.txt")
+    # (path, mtime_ns, size) of the patterns file and what _compiled_patterns built from it
+    _patterns_cache: tuple[tuple, tuple[re.Pattern | None, list[tuple[str, ...]]]] | None = None
 
-    def validate_session_start(self) -> ValidationResult:
+    def validate_session_start(
+        self, limit: int | None = SESSION_START_SCAN_LIMIT
+    ) -> ValidationResult:
         """
         Validate workspace cleanup at session start (soft enforcement)
 
         Checks for leftover artifacts from previous sessions.
-        Returns warnings but allows session to start.
+        Returns warnings but allows session to start. The violations are only
+        shown, so the scan stops after `limit` of them (None scans everything).
+        A limited result holds the first hits in walk order, sorted; they are
+        not necessarily the first `limit` entries of the full sorted list.
         """
-        violations = self._scan_workspace()
+        violations = self._scan_workspace(limit=None if limit is None else limit + 1)
+        truncated = limit is not None and len(violations) > limit
 
-        return ValidationResult(passed=True, violations=violations, enforcement_level="warning")
+        return ValidationResult(
+            passed=True,
+            violations=violations[:limit] if truncated else violations,
+            enforcement_level="warning",
+            truncated=truncated,
+        )
 
     def validate_finalization(self) -> ValidationResult:
         """
@@ -165,14 +305,7 @@ class SessionTracker:
         Skips validation if running in CI/test environments.
         """
         # Skip validation in CI/test environments
-        import os
-
-        if (
-            os.environ.get("RUNNING_IN_CI")
-            or os.environ.get("CI")
-            or os.environ.get("HARNESS_SKIP_CLEANUP")
-            or os.environ.get("PYTEST_CURRENT_TEST")
-        ):
+        if self._skip_cleanup_validation:
             return ValidationResult(passed=True, violations=[], enforcement_level="none")
 
         violations = self._scan_workspace()
@@ -183,45 +316,82 @@ class SessionTracker:
             enforcement_level="blocking" if violations else "none",
         )
 
-    def _scan_workspace(self) -> list[str]:
-        """Scan workspace for cleanup violations"""
-        if not self.PATTERNS_FILE.exists():
+    def _scan_workspace(self, limit: int | None = None) -> list[str]:
+        """Scan workspace for cleanup violations, stopping after `limit` if given.
+
+        The result is sorted, but a limited scan sorts only the hits found so far
+        in directory-walk order.
+        """
+        name_re, path_patterns = self._compiled_patterns()
+        if name_re is None and not path_patterns:
             return []
 
         violations = []
-        workspace = Path.cwd()
-
-        patterns = self._load_patterns()
-
-        for pattern in patterns:
-            files = list(workspace.glob(f"**/{pattern}"))
-
-            files = [
-                f
-                for f in files
-                if not any(part.startswith(".git") for part in f.parts)
-                and not any(part == "venv" for part in f.parts)
-                and not any(part == ".venv" for part in f.parts)
-                and not any(part == "node_modules" for part in f.parts)
-                and not any(part == "__pycache__" for part in f.parts)
-            ]
-
-            for file in files:
-                try:
-                    rel_path = file.relative_to(workspace)
-                    violations.append(str(rel_path))
-                except ValueError:
-                    pass
-
-        return sorted(set(violations))
+        stack: list[tuple[str, tuple[str, ...]]] = [(str(Path.cwd()), ())]
+        while stack:
+            dir_path, dir_parts = stack.pop()
+            try:
+                it = os.scandir(dir_path)
+            except OSError:
+                continue
+            with it:
+                for entry in it:
+                    name = entry.name
+                    if name.startswith(".git") or name in _SCAN_EXCLUDED_NAMES:
+                        continue
+                    parts = (*dir_parts, name)
+                    if (name_re is not None and name_re.match(name)) or any(
+                        _matches_tail(parts, pattern) for pattern in path_patterns
+                    ):
+                        violations.append("/".join(parts))
+                        if limit is not None and len(violations) >= limit:
+                            return sorted(violations)
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append((entry.path, parts))
+                    except OSError:
+                        pass
+
+        return sorted(violations)
+
+    def _compiled_patterns(self) -> tuple[re.Pattern | None, list[tuple[str, ...]]]:
+        """Cleanup patterns compiled for matching, reused until the file changes.
+
+        Plain name patterns are joined into one regex so each entry is tested
+        with a single match() call. Patterns containing `/` are returned split
+        into components, matched against an entry's trailing path components
+        (as `**/<pattern>` would).
+        """
+        try:
+            st = os.stat(self.PATTERNS_FILE)
+        except OSError:
+            return None, []
+        key = (os.path.abspath(self.PATTERNS_FILE), st.st_mtime_ns, st.st_size)
+        cached = SessionTracker._patterns_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        names, path_patterns = [], []
+        for pattern in self._load_patterns():
+            pattern = pattern.strip("/")
+            if "/" in pattern:
+                path_patterns.append(tuple(pattern.split("/")))
+            else:
+                names.append(pattern)
+        name_re = re.compile("|".join(fnmatch.translate(p) for p in names)) if names else None
+        compiled = (name_re, path_patterns)
+        SessionTracker._patterns_cache = (key, compiled)
+        return compiled
 
     def _load_patterns(self) -> list[str]:
         """Load cleanup patterns from file"""
-        if not self.PATTERNS_FILE.exists():
+        try:
+            text = self.PATTERNS_FILE.read_text()
+        except FileNotFoundError:
             return []
 
         patterns = []
-        for line in self.PATTERNS_FILE.read_text().splitlines():
+        for line in text.splitlines():
             line = line.strip()
             if line and not line.startswith("#"):
                 patterns.append(line)
@@ -246,7 +416,9 @@ class SessionTracker:
         for v in validation.violations[:10]:
             print(f"  - {v}")
 
-        if len(validation.violations) > 10:
+        if validation.truncated:
+            print(f"  ... and more (scan stopped after {len(validation.violations)})")
+        elif len(validation.violations) > 10:
             print(f"  ... and {len(validation.violations) - 10} more")
 
         # Check environment variables for agent mode (for backward compatibility)
@@ -269,14 +441,14 @@ class SessionTracker:
             if force:
                 # Agent mode with --yes: auto-clean
                 print("\n🤖 Agent mode: Cleaning up violations (--yes flag detected)")
-                self._cleanup_violations(validation.violations)
+                self._cleanup_violations(self._all_violations(validation))
                 print("✅ Cleanup complete\n")
             else:
                 # Agent mode without --yes: continue with warning
                 print(
                     "\n🤖 Agent mode detected: Continuing with violations (must clean before PR)\n"
                 )
-                self._log_override("session_start", validation.violations)
+                self._log_override("session_start", self._all_violations(validation))
         else:
             # Interactive mode
             print("\nOptions:")
@@ -290,35 +462,43 @@ class SessionTracker:
                 choice = "2"
 
             if choice == "1":
-                self._cleanup_violations(validation.violations)
+                self._cleanup_violations(self._all_violations(validation))
                 print("✅ Cleanup complete\n")
             elif choice == "3":
                 raise Exception("Session initialization aborted by user")
             else:
                 print("⚠️  Continuing with violations (must clean before PR)\n")
-                self._log_override("session_start", validation.violations)
+                self._log_override("session_start", self._all_violations(validation))
+
+    def _all_violations(self, validation: ValidationResult) -> list[str]:
+        """Every violation, rescanning if `validation` only holds the first few."""
+        return self._scan_workspace() if validation.truncated else validation.violations
 
     def _cleanup_violations(self, violations: list[str]):
         """Remove violation files"""
         for violation in violations:
-            file_path = Path(violation)
-            if file_path.exists():
-                try:
-                    if file_path.is_file():
-                        file_path.unlink()
-                    elif file_path.is_dir():
-                        import shutil
-
-                        shutil.rmtree(file_path)
-                except Exception as e:
-                    print(f"⚠️  Could not remove {violation}: {e}")
+            # One lstat gives the type; symlinks are removed, never followed
+            try:
+                mode = os.lstat(violation).st_mode
+            except FileNotFoundError:
+                continue  # already gone, e.g. inside a directory removed earlier
+            except OSError as e:
+                print(f"⚠️  Could not remove {violation}: {e}")
+                continue
+            try:
+                if stat.S_ISDIR(mode):
+                    shutil.rmtree(violation)
+                else:
+                    os.unlink(violation)
+            except Exception as e:
+                print(f"⚠️  Could not remove {violation}: {e}")
 
     def _log_override(self, checkpoint: str, violations: list[str]):
         """Log cleanup override for audit"""
         log_file = Path(".harness/cleanup_overrides.log")
-        with open(log_file, "a") as f:
+        with open(log_file, "ab") as f:
             f.write(
-                json.dumps(
+                _json.dumps(
                     {
                         "timestamp": time.time(),
                         "checkpoint": checkpoint,
@@ -326,7 +506,7 @@ class SessionTracker:
                         "violations": violations[:5],
                     }
                 )
-                + "\n"
+                + b"\n"
             )
 
     @classmethod
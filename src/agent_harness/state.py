@@ -5,7 +5,8 @@ from typing import Annotated, TypedDict
 class ProtocolState(TypedDict):
     """
     State definition for the agentic Protocol LangGraph harness.
-    Using reducers to allow append-only logic for lists.
+    Using reducers to allow append-only logic for lists: nodes return only the
+    keys they change, with list fields holding just the new items.
     """
 
     # Process Context
@@ -29,6 +30,7 @@ class ProtocolState(TypedDict):
     finalization_passed: bool
     blockers: Annotated[list[str], operator.add]
     warnings: Annotated[list[str], operator.add]
+    git_fingerprint: dict | None  # see git_snapshot.snapshot_fingerprint
 
     # Human-in-Loop
     awaiting_approval: bool
@@ -1,7 +1,25 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add src to sys.path
 src_path = Path(__file__).parent.parent / "src"
 if src_path.exists() and str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
+
+
+@pytest.fixture(autouse=True)
+def _reset_compliance_caches():
+    """Drop per-process compliance caches so each test sees its own mocks."""
+    from agent_harness import compliance
+
+    compliance._invalidate_issue_id_cache()
+    compliance._invalidate_session_cache()
+    compliance.invalidate_command_cache()
+    compliance.check_tool_available.cache_clear()
+    yield
+    compliance._invalidate_issue_id_cache()
+    compliance._invalidate_session_cache()
+    compliance.invalidate_command_cache()
+    compliance.check_tool_available.cache_clear()
@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -5,29 +7,33 @@ from unittest.mock import MagicMock, patch
 from agent_harness.compliance import check_handoff_beads_id, check_protocol_compliance_reporting
 
 
-class TestBeadsIDValidator(unittest.TestCase):
-    @patch("agent_harness.compliance.subprocess.check_output")
-    @patch("agent_harness.compliance.Path.home")
-    def test_beads_id_found(self, mock_home, mock_check_output):
-        """Test success when Beads ID is found in debrief.md."""
-        mock_check_output.return_value = "agent/agent-harness-123-fix\n"
+class BrainDirTestCase(unittest.TestCase):
+    """Provides a throwaway home directory with a brain session layout."""
 
-        # Setup mock brain directory
-        temp_dir = MagicMock(spec=Path)
-        mock_home.return_value = temp_dir
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.home = Path(self._tmp.name)
+        self.brain_dir = self.home / ".gemini" / "antigravity" / "brain"
+        self.brain_dir.mkdir(parents=True)
+        home_patcher = patch("agent_harness.compliance.Path.home", return_value=self.home)
+        home_patcher.start()
+        self.addCleanup(home_patcher.stop)
+        self.addCleanup(self._tmp.cleanup)
 
-        brain_dir = temp_dir / ".gemini" / "antigravity" / "brain"
-        brain_dir.exists.return_value = True
+    def make_session(self, name: str, mtime: int, debrief: str) -> Path:
+        session_dir = self.brain_dir / name
+        session_dir.mkdir()
+        (session_dir / "debrief.md").write_text(debrief)
+        os.utime(session_dir, (mtime, mtime))
+        return session_dir
 
-        session_dir = MagicMock(spec=Path)
-        session_dir.is_dir.return_value = True
-        session_dir.stat().st_mtime = 1000
 
-        brain_dir.iterdir.return_value = [session_dir]
-
-        debrief_file = session_dir / "debrief.md"
-        debrief_file.exists.return_value = True
-        debrief_file.read_text.return_value = "This session handles agent-harness-123."
+class TestBeadsIDValidator(BrainDirTestCase):
+    @patch("agent_harness.compliance.subprocess.check_output")
+    def test_beads_id_found(self, mock_check_output):
+        """Test success when Beads ID is found in debrief.md."""
+        mock_check_output.return_value = "agent/agent-harness-123-fix\n"
+        self.make_session("session", 1000, "This session handles agent-harness-123.")
 
         passed, msg = check_handoff_beads_id()
         self.assertTrue(passed)
@@ -35,27 +41,10 @@ class TestBeadsIDValidator(unittest.TestCase):
         self.assertIn("agent-harness-123", msg)
 
     @patch("agent_harness.compliance.subprocess.check_output")
-    @patch("agent_harness.compliance.Path.home")
-    def test_beads_id_not_found(self, mock_home, mock_check_output):
+    def test_beads_id_not_found(self, mock_check_output):
         """Test failure when Beads ID is missing from debrief.md."""
         mock_check_output.return_value = "agent/agent-harness-123-fix\n"
-
-        # Setup mock brain directory
-        temp_dir = MagicMock(spec=Path)
-        mock_home.return_value = temp_dir
-
-        brain_dir = temp_dir / ".gemini" / "antigravity" / "brain"
-        brain_dir.exists.return_value = True
-
-        session_dir = MagicMock(spec=Path)
-        session_dir.is_dir.return_value = True
-        session_dir.stat().st_mtime = 1000
-
-        brain_dir.iterdir.return_value = [session_dir]
-
-        debrief_file = session_dir / "debrief.md"
-        debrief_file.exists.return_value = True
-        debrief_file.read_text.return_value = "No mentions here."
+        self.make_session("session", 1000, "No mentions here.")
 
         passed, msg = check_handoff_beads_id()
         self.assertFalse(passed)
@@ -63,8 +52,7 @@ class TestBeadsIDValidator(unittest.TestCase):
 
     @patch("agent_harness.compliance.subprocess.run")
     @patch("agent_harness.compliance.subprocess.check_output")
-    @patch("agent_harness.compliance.Path.home")
-    def test_fallback_to_bd_list(self, mock_home, mock_check_output, mock_run):
+    def test_fallback_to_bd_list(self, mock_check_output, mock_run):
         """Test fallback to bd list when branch doesn't provide ID."""
         mock_check_output.return_value = "main\n"  # Branch doesn't match agent/*
 
@@ -73,58 +61,20 @@ class TestBeadsIDValidator(unittest.TestCase):
         mock_result.stdout = "agent-harness-999: Some task"
         mock_run.return_value = mock_result
 
-        # Setup mock brain directory
-        temp_dir = MagicMock(spec=Path)
-        mock_home.return_value = temp_dir
-
-        brain_dir = temp_dir / ".gemini" / "antigravity" / "brain"
-        brain_dir.exists.return_value = True
-
-        session_dir = MagicMock(spec=Path)
-        session_dir.is_dir.return_value = True
-        session_dir.stat().st_mtime = 1000
-
-        brain_dir.iterdir.return_value = [session_dir]
-
-        debrief_file = session_dir / "debrief.md"
-        debrief_file.exists.return_value = True
-        debrief_file.read_text.return_value = "Working on agent-harness-999."
+        self.make_session("session", 1000, "Working on agent-harness-999.")
 
         passed, msg = check_handoff_beads_id()
         self.assertTrue(passed)
         self.assertIn("agent-harness-999", msg)
 
     @patch("agent_harness.compliance.subprocess.check_output")
-    @patch("agent_harness.compliance.Path.home")
-    def test_checks_multiple_sessions(self, mock_home, mock_check_output):
+    def test_checks_multiple_sessions(self, mock_check_output):
         """Test that multiple recent sessions are checked."""
         mock_check_output.return_value = "agent/agent-harness-123-fix\n"
 
-        # Setup mock brain directory
-        temp_dir = MagicMock(spec=Path)
-        mock_home.return_value = temp_dir
-
-        brain_dir = temp_dir / ".gemini" / "antigravity" / "brain"
-        brain_dir.exists.return_value = True
-
-        # Latest session (no ID)
-        latest_session = MagicMock(spec=Path)
-        latest_session.is_dir.return_value = True
-        latest_session.stat().st_mtime = 2000
-        latest_debrief = latest_session / "debrief.md"
-        latest_debrief.exists.return_value = True
-        latest_debrief.read_text.return_value = "No ID here."
-
-        # Older session (has ID)
-        older_session = MagicMock(spec=Path)
-        older_session.is_dir.return_value = True
-        older_session.stat().st_mtime = 1000
-        older_debrief = older_session / "debrief.md"
-        older_debrief.exists.return_value = True
-        older_debrief.read_text.return_value = "agent-harness-123 is here."
-
-        # Return both sessions - the validator sorts them and takes [:3]
-        brain_dir.iterdir.return_value = [older_session, latest_session]
+        # Older session (has ID), latest session (no ID)
+        self.make_session("older", 1000, "agent-harness-123 is here.")
+        self.make_session("latest", 2000, "No ID here.")
 
         passed, msg = check_handoff_beads_id()
 
@@ -133,30 +83,15 @@ class TestBeadsIDValidator(unittest.TestCase):
         self.assertIn("agent-harness-123", msg)
 
 
-class TestProtocolComplianceReportingValidator(unittest.TestCase):
+class TestProtocolComplianceReportingValidator(BrainDirTestCase):
     @patch("agent_harness.compliance.subprocess.check_output")
-    @patch("agent_harness.compliance.Path.home")
-    def test_compliance_reporting_success(self, mock_home, mock_check_output):
+    def test_compliance_reporting_success(self, mock_check_output):
         """Test success when compliance statement with ID and 🏁 is found."""
         mock_check_output.return_value = "agent/agent-harness-123-fix\n"
-
-        # Setup mock brain directory
-        temp_dir = MagicMock(spec=Path)
-        mock_home.return_value = temp_dir
-
-        brain_dir = temp_dir / ".gemini" / "antigravity" / "brain"
-        brain_dir.exists.return_value = True
-
-        session_dir = MagicMock(spec=Path)
-        session_dir.is_dir.return_value = True
-        session_dir.stat().st_mtime = 1000
-
-        brain_dir.iterdir.return_value = [session_dir]
-
-        debrief_file = session_dir / "debrief.md"
-        debrief_file.exists.return_value = True
-        debrief_file.read_text.return_value = (
-            "Protocol Compliance: 100% verified via Orchestrator (agent-harness-123) 🏁"
+        self.make_session(
+            "session",
+            1000,
+            "Protocol Compliance: 100% verified via Orchestrator (agent-harness-123) 🏁",
         )
 
         passed, msg = check_protocol_compliance_reporting()
@@ -164,55 +99,21 @@ class TestProtocolComplianceReportingValidator(unittest.TestCase):
         self.assertIn("Full protocol compliance reporting found", msg)
 
     @patch("agent_harness.compliance.subprocess.check_output")
-    @patch("agent_harness.compliance.Path.home")
-    def test_compliance_reporting_missing_id(self, mock_home, mock_check_output):
+    def test_compliance_reporting_missing_id(self, mock_check_output):
         """Test failure when compliance statement is present but missing ID."""
         mock_check_output.return_value = "agent/agent-harness-123-fix\n"
-
-        # Setup mock brain directory
-        temp_dir = MagicMock(spec=Path)
-        mock_home.return_value = temp_dir
-
-        brain_dir = temp_dir / ".gemini" / "antigravity" / "brain"
-        brain_dir.exists.return_value = True
-
-        session_dir = MagicMock(spec=Path)
-        session_dir.is_dir.return_value = True
-        session_dir.stat().st_mtime = 1000
-
-        brain_dir.iterdir.return_value = [session_dir]
-
-        debrief_file = session_dir / "debrief.md"
-        debrief_file.exists.return_value = True
         # Missing ID and 🏁
-        debrief_file.read_text.return_value = "Protocol Compliance: 100% verified via Orchestrator."
+        self.make_session("session", 1000, "Protocol Compliance: 100% verified via Orchestrator.")
 
         passed, msg = check_protocol_compliance_reporting()
         self.assertFalse(passed)
         self.assertIn("missing issue ID 'agent-harness-123' or 🏁", msg)
 
     @patch("agent_harness.compliance.subprocess.check_output")
-    @patch("agent_harness.compliance.Path.home")
-    def test_compliance_reporting_missing_entirely(self, mock_home, mock_check_output):
+    def test_compliance_reporting_missing_entirely(self, mock_check_output):
         """Test failure when compliance statement is missing entirely."""
         mock_check_output.return_value = "agent/agent-harness-123-fix\n"
-
-        # Setup mock brain directory
-        temp_dir = MagicMock(spec=Path)
-        mock_home.return_value = temp_dir
-
-        brain_dir = temp_dir / ".gemini" / "antigravity" / "brain"
-        brain_dir.exists.return_value = True
-
-        session_dir = MagicMock(spec=Path)
-        session_dir.is_dir.return_value = True
-        session_dir.stat().st_mtime = 1000
-
-        brain_dir.iterdir.return_value = [session_dir]
-
-        debrief_file = session_dir / "debrief.md"
-        debrief_file.exists.return_value = True
-        debrief_file.read_text.return_value = "Some other text."
+        self.make_session("session", 1000, "Some other text.")
 
         passed, msg = check_protocol_compliance_reporting()
         self.assertFalse(passed)
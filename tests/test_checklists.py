@@ -1,3 +1,5 @@
+import json
+
 from agent_harness.checklists import ChecklistManager
 
 
@@ -81,3 +83,235 @@ def test_checklist_manager_block(tmp_path):
     assert passed is False
     assert len(blockers) == 1
     assert "Blocking Check" in blockers[0]
+
+
+def test_checklist_manager_fail_fast(tmp_path):
+    checklist_dir = tmp_path / "checklists"
+    checklist_dir.mkdir()
+
+    initialization_json = {
+        "phases": [
+            {
+                "id": "test_phase",
+                "name": "Test Phase",
+                "status": "MANDATORY",
+                "checks": [
+                    {
+                        "id": "check1",
+                        "description": "Blocking Check",
+                        "type": "BLOCKER",
+                        "validator": "always_false",
+                    },
+                    {
+                        "id": "check2",
+                        "description": "Later Check",
+                        "type": "BLOCKER",
+                        "validator": "also_false",
+                    },
+                ],
+            }
+        ]
+    }
+
+    import json
+
+    with open(checklist_dir / "test_phase.json", "w") as f:
+        json.dump(initialization_json, f)
+
+    manager = ChecklistManager(checklist_dir)
+    manager.register_validator("always_false", lambda *args: (False, "Blocked!"))
+    manager.register_validator("also_false", lambda *args: (False, "Also blocked"))
+
+    passed, blockers, warnings = manager.run_phase("test_phase", fail_fast=True)
+
+    assert passed is False
+    assert blockers == ["Blocking Check: Blocked!"]
+    assert warnings == ["Later Check: Skipped after blocker"]
+
+
+def test_checklist_manager_runs_validators_concurrently(tmp_path):
+    import json
+    import threading
+
+    checklist_dir = tmp_path / "checklists"
+    checklist_dir.mkdir()
+
+    checks = [
+        {
+            "id": f"check{i}",
+            "description": f"Check {i}",
+            "type": "WARNING",
+            "validator": "wait",
+            "args": [i],  # distinct args, so the calls are not shared
+        }
+        for i in range(3)
+    ]
+    with open(checklist_dir / "test_phase.json", "w") as f:
+        json.dump(
+            {
+                "phases": [
+                    {"id": "test_phase", "name": "Test", "status": "MANDATORY", "checks": checks}
+                ]
+            },
+            f,
+        )
+
+    # Each validator waits for the others, so this only passes if they overlap
+    barrier = threading.Barrier(3, timeout=5)
+    manager = ChecklistManager(checklist_dir)
+    manager.register_validator("wait", lambda *args: (False, f"waited {barrier.wait()}"))
+
+    passed, blockers, warnings = manager.run_phase("test_phase")
+
+    assert passed is True
+    assert [w.split(":")[0] for w in warnings] == ["Check 0", "Check 1", "Check 2"]
+    assert all(": waited " in w for w in warnings)
+
+
+def test_checklist_manager_runs_identical_checks_once(tmp_path):
+    import json
+
+    checklist_dir = tmp_path / "checklists"
+    checklist_dir.mkdir()
+
+    checks = [
+        {"id": "a", "description": "First", "type": "WARNING", "validator": "count", "args": ["x"]},
+        {"id": "b", "description": "Again", "type": "WARNING", "validator": "count", "args": ["x"]},
+        {"id": "c", "description": "Other", "type": "WARNING", "validator": "count", "args": ["y"]},
+    ]
+    with open(checklist_dir / "test_phase.json", "w") as f:
+        json.dump(
+            {
+                "phases": [
+                    {"id": "test_phase", "name": "Test", "status": "MANDATORY", "checks": checks}
+                ]
+            },
+            f,
+        )
+
+    calls = []
+    manager = ChecklistManager(checklist_dir)
+    manager.register_validator("count", lambda *args: calls.append(args) or (False, "seen"))
+
+    passed, blockers, warnings = manager.run_phase("test_phase")
+
+    assert sorted(calls) == [("x",), ("y",)]
+    assert warnings == ["First: seen", "Again: seen", "Other: seen"]
+
+
+def test_checklist_parsed_once_until_file_changes(tmp_path):
+    import json
+
+    checklist_dir = tmp_path / "checklists"
+    checklist_dir.mkdir()
+    path = checklist_dir / "test_phase.json"
+
+    def write(name):
+        with open(path, "w") as f:
+            json.dump({"phases": [{"id": "p", "name": name, "status": "MANDATORY"}]}, f)
+
+    write("First")
+    first = ChecklistManager(checklist_dir).load_checklist("test_phase")
+    assert ChecklistManager(checklist_dir).load_checklist("test_phase") is first
+
+    write("Second version")
+    assert ChecklistManager(checklist_dir).load_checklist("test_phase").name == "Second version"
+
+
+def test_register_validators_adds_mapping(tmp_path):
+    def first():
+        return True
+
+    def second():
+        return False
+
+    manager = ChecklistManager(tmp_path)
+    manager.register_validator("first", lambda: None)
+    manager.register_validators({"first": first, "second": second})
+
+    assert manager.validators == {"first": first, "second": second}
+
+
+def _write_phase(checklist_dir, checks):
+    checklist_dir.mkdir(exist_ok=True)
+    (checklist_dir / "test_phase.json").write_text(
+        json.dumps(
+            {
+                "phases": [
+                    {
+                        "id": "test_phase",
+                        "name": "Test Phase",
+                        "status": "MANDATORY",
+                        "checks": [
+                            {
+                                "id": validator,
+                                "description": validator.title(),
+                                "type": "BLOCKER",
+                                "validator": validator,
+                            }
+                            for validator in checks
+                        ],
+                    }
+                ]
+            }
+        )
+    )
+
+
+def test_mutating_validator_skipped_when_blocked(tmp_path):
+    checklist_dir = tmp_path / "checklists"
+    _write_phase(checklist_dir, ["post", "gate"])
+    posted = []
+
+    manager = ChecklistManager(checklist_dir)
+    manager.register_validator("post", lambda: posted.append(1) or (True, "posted"), mutating=True)
+    manager.register_validator("gate", lambda: (False, "Blocked!"))
+
+    for fail_fast in (True, False):
+        passed, blockers, warnings = manager.run_phase("test_phase", fail_fast=fail_fast)
+
+        assert passed is False
+        assert blockers == ["Gate: Blocked!"]
+        assert warnings == ["Post: Skipped after blocker"]
+    assert posted == []
+
+
+def test_mutating_validator_runs_after_read_only_checks(tmp_path):
+    checklist_dir = tmp_path / "checklists"
+    _write_phase(checklist_dir, ["post", "read"])
+    order = []
+
+    manager = ChecklistManager(checklist_dir)
+    manager.register_validator(
+        "post", lambda: order.append("post") or (True, "posted"), mutating=True
+    )
+    manager.register_validator("read", lambda: order.append("read") or (True, "ok"))
+
+    assert manager.run_phase("test_phase", fail_fast=True) == (True, [], [])
+    assert order == ["read", "post"]
+
+
+def test_fail_fast_waits_for_running_validators(tmp_path):
+    import threading
+    import time
+
+    checklist_dir = tmp_path / "checklists"
+    _write_phase(checklist_dir, ["gate", "slow"])
+    started, finished = threading.Event(), threading.Event()
+
+    def slow():
+        started.set()
+        time.sleep(0.2)
+        finished.set()
+        return True, "ok"
+
+    manager = ChecklistManager(checklist_dir)
+    manager.register_validator("gate", lambda: (started.wait(5) and False, "Blocked!"))
+    manager.register_validator("slow", slow)
+
+    passed, blockers, _ = manager.run_phase("test_phase", fail_fast=True)
+
+    assert passed is False
+    assert blockers == ["Gate: Blocked!"]
+    # The blocker ends the phase, but the check already running must not outlive it
+    assert finished.is_set()
@@ -2,7 +2,12 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from agent_harness.compliance import check_branch_info, get_active_issue_id
+from agent_harness.compliance import (
+    check_branch_info,
+    check_tool_available,
+    get_active_issue_id,
+    invalidate_command_cache,
+)
 
 
 @pytest.mark.parametrize(
@@ -39,3 +44,29 @@ def test_check_branch_info_flexible(branch_name, expected_is_feature):
         mock_run.return_value = MagicMock(returncode=0, stdout=branch_name)
         _, is_feature = check_branch_info()
         assert is_feature == expected_is_feature
+
+
+def test_get_active_issue_id_is_cached_per_process():
+    with patch("subprocess.check_output") as mock_git:
+        mock_git.return_value = "agent/agent-harness-abc-fix"
+        assert get_active_issue_id() == "agent-harness-abc"
+        assert get_active_issue_id() == "agent-harness-abc"
+        assert mock_git.call_count == 1
+
+
+def test_get_active_issue_id_refreshed_by_command_cache_invalidation():
+    with patch("subprocess.check_output") as mock_git:
+        mock_git.return_value = "main"
+        with patch("agent_harness.compliance.check_tool_available", return_value=False):
+            assert get_active_issue_id() is None
+        invalidate_command_cache()  # next checklist pass, after a branch switch
+        mock_git.return_value = "agent/agent-harness-abc-fix"
+        assert get_active_issue_id() == "agent-harness-abc"
+
+
+def test_check_tool_available_is_cached_per_process():
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(returncode=0)
+        assert check_tool_available("bd")
+        assert check_tool_available("bd")
+        assert mock_run.call_count == 1
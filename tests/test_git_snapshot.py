@@ -0,0 +1,106 @@
+"""Tests for the shared git snapshot used by checklist validators."""
+
+import os
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from agent_harness.compliance import check_branch_info, check_git_status
+from agent_harness.git_snapshot import (
+    GitSnapshot,
+    collect_git_snapshot,
+    current_git_snapshot,
+    git_snapshot_pass,
+    snapshot_fingerprint,
+    snapshot_from_fingerprint,
+)
+
+
+class TestGitSnapshot(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.repo = Path(self._tmp.name)
+        self._git("init", "-q", "-b", "main")
+        cwd = os.getcwd()
+        os.chdir(self.repo)
+        self.addCleanup(os.chdir, cwd)
+
+    def _git(self, *args):
+        subprocess.run(["git", *args], cwd=self.repo, check=True, capture_output=True)
+
+    def _commit(self):
+        self._git("-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", "c")
+
+    def test_branch_before_first_commit(self):
+        snapshot = collect_git_snapshot()
+
+        self.assertEqual(snapshot.branch, "main")
+        self.assertTrue(snapshot.clean)
+
+    def test_parses_entries(self):
+        (self.repo / "a.py").write_text("a\n")
+        (self.repo / "b.md").write_text("b\n")
+        self._git("add", "a.py", "b.md")
+        self._commit()
+        (self.repo / "a.py").write_text("changed\n")
+        self._git("mv", "b.md", "c.md")
+        (self.repo / "new file.txt").write_text("x")
+
+        snapshot = collect_git_snapshot()
+
+        self.assertEqual(snapshot.branch, "main")
+        self.assertEqual(
+            sorted(snapshot.entries),
+            [(" M", "a.py"), ("??", "new file.txt"), ("R ", "b.md -> c.md")],
+        )
+        self.assertEqual(snapshot.untracked, ["new file.txt"])
+        self.assertFalse(snapshot.clean)
+
+    def test_detached_head_has_empty_branch(self):
+        (self.repo / "a.py").write_text("a\n")
+        self._git("add", "a.py")
+        self._commit()
+        self._git("checkout", "-q", "--detach")
+
+        self.assertEqual(collect_git_snapshot().branch, "")
+
+    def test_outside_git_returns_none(self):
+        with tempfile.TemporaryDirectory() as plain:
+            os.chdir(plain)
+            self.assertIsNone(collect_git_snapshot())
+
+    def test_validators_share_the_pass_snapshot(self):
+        (self.repo / "notes.md").write_text("x")
+
+        with git_snapshot_pass():
+            with patch("agent_harness.compliance.subprocess.run") as run:
+                self.assertEqual(check_git_status(), (False, "Uncommitted changes:\n?? notes.md"))
+                self.assertEqual(check_branch_info(), ("main", False))
+            run.assert_not_called()
+
+        self.assertIsNone(current_git_snapshot())
+
+    def test_pass_reuses_given_snapshot(self):
+        earlier = GitSnapshot(branch="feature", entries=[("??", "old.md")])
+
+        with patch("agent_harness.git_snapshot.subprocess.run") as run:
+            with git_snapshot_pass(earlier) as snapshot:
+                self.assertIs(snapshot, earlier)
+                self.assertEqual(check_branch_info(), ("feature", False))
+            run.assert_not_called()
+
+    def test_fingerprint_round_trip_and_expiry(self):
+        snapshot = GitSnapshot(branch="main", entries=[(" M", "a.py")])
+        fingerprint = snapshot_fingerprint(snapshot)
+
+        self.assertEqual(snapshot_from_fingerprint(fingerprint), snapshot)
+        self.assertIsNone(snapshot_from_fingerprint(fingerprint, max_age=0))
+        self.assertIsNone(snapshot_from_fingerprint(None))
+        self.assertIsNone(snapshot_fingerprint(None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,215 @@
+"""Tests for GitWorktreeManager cleanup validation against a real git repository."""
+
+import io
+import os
+import subprocess
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from agent_harness.git_worktree_manager import GitWorktreeManager
+
+
+class TestValidateWorktreeCleanup(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.repo = Path(self._tmp.name)
+        self._git("init", "-q")
+        (self.repo / "README.md").write_text("hello\n")
+        (self.repo / ".gitignore").write_text("")
+        self._git("add", "README.md", ".gitignore")
+        self._git("-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", "init")
+        self.manager = GitWorktreeManager(self.repo)
+
+    def _git(self, *args):
+        subprocess.run(["git", *args], cwd=self.repo, check=True, capture_output=True)
+
+    def test_clean_worktree_has_no_violations(self):
+        self.assertEqual(self.manager.validate_worktree_cleanup(self.repo), [])
+
+    def test_missing_worktree_is_clean(self):
+        self.assertEqual(self.manager.validate_worktree_cleanup(self.repo / "gone"), [])
+
+    def test_detects_nested_temp_files(self):
+        (self.repo / "pkg" / "sub").mkdir(parents=True)
+        (self.repo / "pkg" / "sub" / "debug_output.log").write_text("x")
+        (self.repo / "notes.tmp").write_text("x")
+
+        violations = self.manager.validate_worktree_cleanup(self.repo)
+
+        self.assertIn("Temporary files (*.tmp): ['notes.tmp']", violations)
+        self.assertIn("Temporary files (debug_*): ['debug_output.log']", violations)
+        self.assertIn("Uncommitted changes in worktree", violations)
+
+    def test_name_matching_several_patterns_reported_under_each(self):
+        (self.repo / "debug_run.tmp").write_text("x")
+
+        violations = self.manager.validate_worktree_cleanup(self.repo)
+
+        self.assertIn("Temporary files (*.tmp): ['debug_run.tmp']", violations)
+        self.assertIn("Temporary files (debug_*): ['debug_run.tmp']", violations)
+
+    def test_detects_modified_tracked_file(self):
+        (self.repo / "README.md").write_text("changed\n")
+
+        self.assertEqual(
+            self.manager.validate_worktree_cleanup(self.repo), ["Uncommitted changes in worktree"]
+        )
+
+    def test_ignores_git_metadata(self):
+        (self.repo / ".git" / "scratch.tmp").write_text("x")
+
+        self.assertEqual(self.manager.validate_worktree_cleanup(self.repo), [])
+
+    def test_ignores_other_git_prefixed_dirs(self):
+        (self.repo / ".github" / "workflows").mkdir(parents=True)
+        (self.repo / ".github" / "workflows" / "debug_ci.yml").write_text("x")
+
+        violations = self.manager.validate_worktree_cleanup(self.repo)
+
+        self.assertFalse([v for v in violations if v.startswith("Temporary files")])
+
+    def test_detects_committed_large_files(self):
+        with open(self.repo / "data.bin", "wb") as f:
+            f.truncate(10_000_001)
+        self._git("add", "data.bin")
+        self._git("-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", "data")
+
+        self.assertEqual(
+            self.manager.validate_worktree_cleanup(self.repo),
+            ["Large files (>10MB): ['data.bin']"],
+        )
+
+    def test_skips_gitignored_temp_files(self):
+        (self.repo / ".gitignore").write_text("*.tmp\n")
+        self._git("-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qam", "ignore tmp")
+        (self.repo / "build.tmp").write_text("x")
+
+        self.assertEqual(self.manager.validate_worktree_cleanup(self.repo), [])
+
+    def test_falls_back_to_filesystem_walk_outside_git(self):
+        with tempfile.TemporaryDirectory() as plain:
+            (Path(plain) / "nested").mkdir()
+            (Path(plain) / "nested" / "WIP_draft.md").write_text("x")
+
+            violations = self.manager.validate_worktree_cleanup(Path(plain))
+
+        self.assertIn("Temporary files (WIP_*): ['WIP_draft.md']", violations)
+
+    def test_filesystem_walk_prunes_nested_git_dirs(self):
+        with tempfile.TemporaryDirectory() as plain:
+            (Path(plain) / "vendor" / ".git").mkdir(parents=True)
+            (Path(plain) / "vendor" / ".git" / "scratch.tmp").write_text("x")
+            (Path(plain) / "vendor" / ".github").mkdir()
+            (Path(plain) / "vendor" / ".github" / "debug_ci.yml").write_text("x")
+
+            violations = self.manager.validate_worktree_cleanup(Path(plain))
+
+        self.assertFalse([v for v in violations if v.startswith("Temporary files")])
+
+    def test_detects_large_files(self):
+        with open(self.repo / "blob.bin", "wb") as f:
+            f.truncate(10_000_001)
+
+        violations = self.manager.validate_worktree_cleanup(self.repo)
+
+        self.assertIn("Large files (>10MB): ['blob.bin']", violations)
+
+    def test_reports_at_most_three_examples_per_check(self):
+        for i in range(5):
+            (self.repo / f"scratch{i}.tmp").write_text("x")
+            with open(self.repo / f"blob{i}.bin", "wb") as f:
+                f.truncate(10_000_001)
+
+        violations = self.manager.validate_worktree_cleanup(self.repo)
+
+        temp = next(v for v in violations if v.startswith("Temporary files (*.tmp)"))
+        large = next(v for v in violations if v.startswith("Large files"))
+        self.assertEqual(temp.count(".tmp'"), 3)
+        self.assertEqual(large.count(".bin'"), 3)
+
+
+class TestCleanupOrphanedWorktrees(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        root = Path(self._tmp.name)
+        self.repo = root / "repo"
+        self.repo.mkdir()
+        self._git("init", "-q")
+        (self.repo / "README.md").write_text("hello\n")
+        self._git("add", "README.md")
+        self._git("-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", "init")
+        self.worktree = root / "wt"
+        self._git("worktree", "add", "-q", str(self.worktree), "-b", "agent/x")
+        self.manager = GitWorktreeManager(self.repo)
+
+    def _git(self, *args):
+        subprocess.run(["git", *args], cwd=self.repo, check=True, capture_output=True)
+
+    def _age(self, path, days=2):
+        old = time.time() - days * 86400
+        os.utime(path, (old, old))
+
+    def test_removes_stale_clean_worktree(self):
+        self._age(self.worktree)
+        self._age(self.repo / ".git" / "worktrees" / "wt" / "HEAD")
+
+        self.assertEqual(self.manager.cleanup_orphaned_worktrees(), [str(self.worktree)])
+        self.assertFalse(self.worktree.exists())
+
+    def test_keeps_stale_worktree_with_changes(self):
+        dirty = self.worktree.parent / "wt-dirty"
+        self._git("worktree", "add", "-q", str(dirty), "-b", "agent/y")
+        (dirty / "notes.md").write_text("x")
+        for name in ("wt", "wt-dirty"):
+            self._age(self.worktree.parent / name)
+            self._age(self.repo / ".git" / "worktrees" / name / "HEAD")
+
+        self.assertEqual(self.manager.cleanup_orphaned_worktrees(), [str(self.worktree)])
+        self.assertTrue(dirty.exists())
+
+    def test_recent_head_skips_git_status(self):
+        self._age(self.worktree)
+
+        with patch(
+            "agent_harness.git_worktree_manager.subprocess.run", wraps=subprocess.run
+        ) as run:
+            self.assertEqual(self.manager.cleanup_orphaned_worktrees(), [])
+
+        commands = [c.args[0][:2] for c in run.call_args_list]
+        self.assertNotIn(["git", "status"], commands)
+        self.assertTrue(self.worktree.exists())
+
+
+class TestListWorktrees(unittest.TestCase):
+    def test_parses_porcelain_output(self):
+        porcelain = (
+            b"worktree /repo\nHEAD abc123\nbranch refs/heads/main\n\n"
+            b"worktree /wt/agent one\nHEAD def456\nbranch refs/heads/agent/x\n\n"
+            b"worktree /wt/detached\nHEAD 789abc\ndetached\n"
+        )
+        proc = MagicMock(stdout=io.BytesIO(porcelain), returncode=0)
+        proc.__enter__.return_value = proc
+        with patch("agent_harness.git_worktree_manager.subprocess.Popen", return_value=proc):
+            worktrees = GitWorktreeManager(Path("/repo")).list_worktrees()
+
+        self.assertEqual(
+            worktrees,
+            [
+                {"path": "/repo", "head": "abc123", "branch": "refs/heads/main"},
+                {"path": "/wt/agent one", "head": "def456", "branch": "refs/heads/agent/x"},
+                {"path": "/wt/detached", "head": "789abc"},
+            ],
+        )
+
+    def test_returns_empty_outside_git(self):
+        with tempfile.TemporaryDirectory() as plain:
+            self.assertEqual(GitWorktreeManager(Path(plain)).list_worktrees(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
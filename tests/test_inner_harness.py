@@ -1,8 +1,15 @@
 """Tests for InnerHarness - the minimal Pi Mono-style agent loop."""
 
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import patch
+
 import pytest
 
 from agent_harness.inner import (
+    HARDENED_SYSTEM_PROMPT,
     BashTool,
     EditTool,
     InnerHarness,
@@ -10,6 +17,50 @@ from agent_harness.inner import (
     Tool,
     WriteTool,
 )
+from agent_harness.session_tracker import SessionTracker
+
+
+def _tool_call(call_id, name, arguments):
+    class ToolCall:
+        id = call_id
+
+        class function:
+            pass
+
+    ToolCall.function.name = name
+    ToolCall.function.arguments = json.dumps(arguments)
+    return ToolCall()
+
+
+class _RendezvousTool(Tool):
+    """Returns its value once `parties` calls are running at the same time."""
+
+    def __init__(self, parties):
+        self._barrier = threading.Barrier(parties, timeout=5)
+        self._lock = threading.Lock()
+        self._active = 0
+        self.max_active = 0
+
+    @property
+    def name(self):
+        return "meet"
+
+    @property
+    def description(self):
+        return "Wait for the other calls"
+
+    def execute(self, value):
+        with self._lock:
+            self._active += 1
+            self.max_active = max(self.max_active, self._active)
+        try:
+            self._barrier.wait()
+        except threading.BrokenBarrierError:
+            return "ran alone"
+        finally:
+            with self._lock:
+                self._active -= 1
+        return value
 
 
 class TestCoreTools:
@@ -20,6 +71,12 @@ class TestCoreTools:
         assert tool.name == "read"
         assert "file" in tool.description.lower()
 
+    def test_read_tool_reads_utf8(self, tmp_path):
+        target = tmp_path / "f.txt"
+        target.write_bytes("héllo\n".encode() + b"\xff")
+        assert ReadTool().execute(str(target)) == "héllo\n\ufffd"
+        assert "Error reading file" in ReadTool().execute(str(tmp_path / "missing"))
+
     def test_write_tool_exists(self):
         tool = WriteTool()
         assert tool.name == "write"
@@ -30,6 +87,13 @@ class TestCoreTools:
         assert tool.name == "edit"
         assert "old_content" in tool.description.lower()
 
+    def test_edit_tool_replaces_first_occurrence(self, tmp_path):
+        target = tmp_path / "f.txt"
+        target.write_text("a b a b")
+        assert "Successfully" in EditTool().execute(str(target), "b", "XY")
+        assert target.read_text() == "a XY a b"
+        assert "not found" in EditTool().execute(str(target), "zzz", "q")
+
     def test_bash_tool_exists(self):
         tool = BashTool()
         assert tool.name == "bash"
@@ -40,6 +104,38 @@ class TestCoreTools:
         result = tool.execute("echo hello")
         assert "hello" in result
 
+    def test_bash_tool_async_executes_command(self):
+        tool = BashTool()
+        result = asyncio.run(tool.aexecute(command="echo hello; echo oops >&2"))
+        assert result == "hello\noops\n"
+
+    def test_bash_tool_async_cancel_kills_command(self, tmp_path):
+        marker = tmp_path / "late"
+
+        async def main():
+            task = asyncio.create_task(BashTool().aexecute(command=f"sleep 0.3; touch {marker}"))
+            await asyncio.sleep(0.1)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(main())
+        time.sleep(0.5)
+        assert not marker.exists()
+
+    def test_bash_tool_async_timeout_reports_timeout(self):
+        with patch("agent_harness.inner._BASH_TIMEOUT_SECONDS", 0.1):
+            result = asyncio.run(BashTool().aexecute(command="sleep 5"))
+        assert result == "Error: command timed out after 0.1 seconds"
+
+    def test_bash_tool_caps_output_but_lets_command_finish(self, tmp_path):
+        tool = BashTool()
+        marker = tmp_path / "finished"
+        result = tool.execute(f"seq 1 200000; touch {marker}")
+        assert len(result) == 4000
+        assert result.startswith("1\n2\n3\n")
+        assert marker.exists()
+
     def test_bash_tool_handles_error(self):
         tool = BashTool()
         result = tool.execute("exit 1")
@@ -96,6 +192,64 @@ class TestInnerHarness:
         assert len(harness.tools) == 1
         assert "custom" in harness.tools
 
+    def test_execute_tool_dispatches_by_name(self):
+        """Tool calls reach the named tool; unknown names are reported."""
+
+        class EchoTool(Tool):
+            @property
+            def name(self):
+                return "echo"
+
+            @property
+            def description(self):
+                return "Echo a value"
+
+            def execute(self, value):
+                return f"echo: {value}"
+
+        def call(name, arguments):
+            class ToolCall:
+                class function:
+                    pass
+
+            ToolCall.function.name = name
+            ToolCall.function.arguments = arguments
+            return ToolCall()
+
+        harness = InnerHarness(llm_client=object(), tools=[EchoTool()], hardened=False)
+        assert harness._execute_tool(call("echo", '{"value": "hi"}')) == "echo: hi"
+        assert harness._execute_tool(call("missing", "{}")) == "Unknown tool: missing"
+        assert harness._execute_tool_calls(
+            [call("echo", '{"value": "a"}'), call("echo", '{"value": "b"}')]
+        ) == ["echo: a", "echo: b"]
+
+    def test_tools_schema_built_once(self):
+        """The same tool schema is sent on every iteration."""
+        schemas = []
+
+        class MockLLM:
+            def invoke(self, messages, **kwargs):
+                schemas.append(kwargs["tools"])
+
+                class ToolCall:
+                    id = "tc1"
+
+                    class function:
+                        name = "bash"
+                        arguments = '{"command": "true"}'
+
+                class Response:
+                    content = "Using tool"
+                    tool_calls = [ToolCall()]
+
+                return Response()
+
+        harness = InnerHarness(llm_client=MockLLM(), hardened=False)
+        harness.run("Loop", max_iterations=3)
+        assert len(schemas) == 3
+        assert all(schema is schemas[0] for schema in schemas)
+        assert [t["function"]["name"] for t in schemas[0]] == ["read", "write", "edit", "bash"]
+
     def test_custom_system_prompt(self):
         """Harness should accept custom system prompt."""
 
@@ -110,6 +264,15 @@ class TestInnerHarness:
         harness = InnerHarness(llm_client=MockLLM(), system_prompt="Custom prompt", hardened=False)
         assert harness.system_prompt == "Custom prompt"
 
+    def test_default_hardened_prompt_is_prebuilt(self):
+        """The default hardened prompt reuses the module-level constant."""
+        harness = InnerHarness(llm_client=object())
+        assert harness.system_prompt is HARDENED_SYSTEM_PROMPT
+
+        custom = InnerHarness(llm_client=object(), system_prompt="Custom prompt")
+        assert "Custom prompt" in custom.system_prompt
+        assert "CRITICAL CONSTRAINTS" in custom.system_prompt
+
     def test_run_no_tools(self):
         """Run should return when LLM doesn't request tools."""
 
@@ -152,6 +315,87 @@ class TestInnerHarness:
         assert "Max iterations" in result
         assert call_count == 3
 
+    def test_parallel_tool_calls_run_concurrently(self):
+        """Tool calls from one turn run together and results keep call order."""
+        turns = []
+        tool = _RendezvousTool(parties=2)
+
+        class MockLLM:
+            def invoke(self, messages, **kwargs):
+                turns.append(list(messages))
+
+                class Response:
+                    content = "Done"
+                    tool_calls = None
+
+                if len(turns) == 1:
+                    Response.tool_calls = [
+                        _tool_call("a", "meet", {"value": "first"}),
+                        _tool_call("b", "meet", {"value": "second"}),
+                    ]
+                return Response()
+
+        harness = InnerHarness(llm_client=MockLLM(), tools=[tool], hardened=False)
+        assert harness.run("Run both") == "Done"
+
+        tool_messages = [m for m in turns[1] if m["role"] == "tool"]
+        assert [(m["tool_call_id"], m["content"]) for m in tool_messages] == [
+            ("a", "first"),
+            ("b", "second"),
+        ]
+
+    def test_hardened_violation_stops_later_calls(self, tmp_path, monkeypatch):
+        """An auditor violation ends the turn before the next call starts."""
+        monkeypatch.chdir(tmp_path)
+        marker = tmp_path / "ran"
+
+        class MockLLM:
+            def invoke(self, messages, **kwargs):
+                class Response:
+                    content = "Working"
+                    tool_calls = [
+                        _tool_call("a", "read", {"path": "/etc/hostname"}),
+                        _tool_call("b", "bash", {"command": f"touch {marker}"}),
+                    ]
+
+                return Response()
+
+        with patch.object(SessionTracker, "has_active_session", return_value=True):
+            harness = InnerHarness(llm_client=MockLLM(), hardened=True)
+            assert harness.run("Look around").startswith("Security Violation")
+
+        assert not marker.exists()
+
+    def test_tool_calls_run_concurrently_inside_event_loop(self):
+        """Called from async code, tool calls still run side by side."""
+        harness = InnerHarness(
+            llm_client=object(), tools=[_RendezvousTool(parties=2)], hardened=False
+        )
+        calls = [_tool_call("a", "meet", {"value": "x"}), _tool_call("b", "meet", {"value": "y"})]
+
+        async def main():
+            return harness._execute_tool_calls(calls)
+
+        assert asyncio.run(main()) == ["x", "y"]
+
+    def test_hardened_tool_calls_stay_sequential_inside_event_loop(self, tmp_path, monkeypatch):
+        """With an auditor, calls never overlap, even from async code."""
+        monkeypatch.chdir(tmp_path)
+        # A single party: every call passes on its own, so nothing waits on a peer
+        tool = _RendezvousTool(parties=1)
+        calls = [_tool_call("a", "meet", {"value": "x"}), _tool_call("b", "meet", {"value": "y"})]
+
+        with patch.object(SessionTracker, "has_active_session", return_value=True):
+            harness = InnerHarness(llm_client=object(), tools=[tool], hardened=True)
+
+            async def main():
+                return harness._execute_tool_calls(calls)
+
+            assert asyncio.run(main()) == ["x", "y"]
+
+        assert tool.max_active == 1
+        assert harness.auditor.get_stats()["total_calls"] == 2
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
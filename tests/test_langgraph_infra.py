@@ -64,6 +64,106 @@ def test_langgraph_infrastructure():
         os.remove(db_path)
 
 
+def test_compiled_graph_reused_until_db_replaced(tmp_path):
+    from agent_harness.engine import _compiled_graph, _db_file_id
+
+    db_path = str(tmp_path / "harness_state.db")
+    first = _compiled_graph(db_path, _db_file_id(db_path))
+    assert _compiled_graph(db_path, _db_file_id(db_path)) is first
+
+    # A deleted database must not be served by the stale cached connection
+    os.remove(db_path)
+    assert _compiled_graph(db_path, _db_file_id(db_path)) is not first
+
+
+def test_replaced_graph_closes_old_connection(tmp_path):
+    import sqlite3
+
+    import pytest
+
+    from agent_harness.engine import _compiled_graph, _db_file_id
+
+    db_path = str(tmp_path / "harness_state.db")
+    first = _compiled_graph(db_path, _db_file_id(db_path))
+    os.remove(db_path)
+    second = _compiled_graph(db_path, _db_file_id(db_path))
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        first.checkpointer.conn.execute("SELECT 1")
+    assert second.checkpointer.conn.execute("SELECT 1").fetchone() == (1,)
+
+
+def test_run_harness_probes_checkpoint_instead_of_state():
+    from unittest.mock import MagicMock, patch
+
+    from agent_harness.engine import run_harness
+
+    graph = MagicMock()
+    graph.checkpointer.get_tuple.return_value = None
+    with patch("agent_harness.engine._compiled_graph", return_value=graph):
+        run_harness("P-1", "Fresh thread", "fresh-thread", db_path=":memory:")
+
+    graph.get_state.assert_not_called()
+    initial_state = graph.invoke.call_args.args[0]
+    assert initial_state["process_id"] == "P-1"
+    assert initial_state["current_phase"] == "INIT"
+
+
+def test_node_updates_append_list_fields_once():
+    from agent_harness.nodes.execution import human_approval_node
+
+    builder = StateGraph(ProtocolState)
+    builder.add_node("approval", human_approval_node)
+    builder.set_entry_point("approval")
+    builder.add_edge("approval", END)
+
+    step = {"index": 0, "task_id": "Initialization"}
+    result = builder.compile().invoke(
+        {
+            "process_id": "P-1",
+            "goals": ["Ship it"],
+            "steps_completed": [step],
+            "blockers": [],
+            "warnings": [],
+        }
+    )
+
+    assert result["current_phase"] == "APPROVED"
+    assert result["goals"] == ["Ship it"]
+    assert result["steps_completed"] == [step]
+
+
+def test_checkpointer_connection_uses_wal(tmp_path):
+    checkpointer = get_sqlite_checkpointer(str(tmp_path / "harness_state.db"))
+
+    assert checkpointer.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert checkpointer.conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+
+def test_human_approval_status_goes_to_stderr(capsys):
+    from agent_harness.nodes.execution import human_approval_node
+
+    human_approval_node({"process_id": "P-1"})
+
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert captured.err == "✋ Awaiting manual approval for P-1\n"
+
+
+def test_execution_drops_git_fingerprint():
+    from unittest.mock import patch
+
+    from agent_harness.nodes.execution import execution_node
+
+    with patch(
+        "agent_harness.nodes.execution.sisyphus_orchestrator",
+        return_value={"current_phase": "Execution"},
+    ):
+        update = execution_node({"git_fingerprint": {"branch": "main", "entries": [], "ts": 0}})
+
+    assert update == {"current_phase": "Execution", "git_fingerprint": None}
+
+
 if __name__ == "__main__":
     test_langgraph_infrastructure()
     print("✅ LangGraph Infrastructure Test Passed!")
@@ -23,8 +23,7 @@ class TestMissingValidators(unittest.TestCase):
 
     @patch("agent_harness.compliance.check_tool_available")
     @patch("agent_harness.compliance.subprocess.run")
-    @patch("agent_harness.compliance.json.loads")
-    def test_check_closed_issue_branches_stale(self, mock_json, mock_run, mock_tool):
+    def test_check_closed_issue_branches_stale(self, mock_run, mock_tool):
         mock_tool.return_value = True
 
         # Mock git branch output
@@ -38,13 +37,33 @@ class TestMissingValidators(unittest.TestCase):
         mock_bd.stdout = '{"status": "closed"}'
 
         mock_run.side_effect = [mock_git, mock_bd]
-        mock_json.return_value = {"status": "closed"}
 
         passed, msg = check_closed_issue_branches()
         self.assertFalse(passed)
         self.assertIn("Stale branches detected", msg)
         self.assertIn("agent-harness-abc", msg)
 
+    @patch("agent_harness.compliance.check_tool_available")
+    @patch("agent_harness.compliance.subprocess.run")
+    def test_check_closed_issue_branches_batches_bd_show(self, mock_run, mock_tool):
+        mock_tool.return_value = True
+
+        def run(args, **kwargs):
+            if args[:2] == ["git", "branch"]:
+                return MagicMock(returncode=0, stdout="main\nagent/proj-abc-x\nagent/proj-def-y\n")
+            if args == ["bd", "show", "proj-abc", "proj-def", "--json"]:
+                return MagicMock(returncode=1, stdout="")  # proj-def unknown: batch rejected
+            if args == ["bd", "show", "proj-abc", "--json"]:
+                return MagicMock(returncode=0, stdout='[{"id": "proj-abc", "status": "closed"}]')
+            return MagicMock(returncode=1, stdout="")
+
+        mock_run.side_effect = run
+
+        passed, msg = check_closed_issue_branches()
+        self.assertFalse(passed)
+        self.assertIn("agent/proj-abc-x (Issue proj-abc closed)", msg)
+        self.assertNotIn("proj-def", msg)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -6,6 +6,7 @@ from agent_harness.compliance import (
     check_beads_pr_sync,
     check_handoff_pr_verification,
     check_pr_exists,
+    check_tool_version,
     check_workspace_cleanup,
 )
 
@@ -31,7 +32,7 @@ class TestPortedValidators(unittest.TestCase):
                     "url": "https://github.com/PR1",
                 }
             ]
-        )
+        ).encode()
         mock_run.return_value = mock_result
 
         passed, msg = check_handoff_pr_verification()
@@ -51,7 +52,7 @@ class TestPortedValidators(unittest.TestCase):
         mock_result.returncode = 0
         mock_result.stdout = json.dumps(
             {"title": "[issue-123] Implementation", "body": "Fixes issue-123"}
-        )
+        ).encode()
         mock_run.return_value = mock_result
 
         passed, msg = check_beads_pr_sync()
@@ -62,7 +63,7 @@ class TestPortedValidators(unittest.TestCase):
     def test_workspace_cleanup_clean(self, mock_run):
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = "task.md\ndebrief.md\n.reflection_input.json"
+        mock_result.stdout = b"task.md\0debrief.md\0.reflection_input.json\0"
         mock_run.return_value = mock_result
 
         passed, msg = check_workspace_cleanup()
@@ -73,7 +74,7 @@ class TestPortedValidators(unittest.TestCase):
     def test_workspace_cleanup_drift(self, mock_run):
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = "task.md\njunk.bak"
+        mock_result.stdout = b"task.md\0junk.bak\0"
         mock_run.return_value = mock_result
 
         passed, msg = check_workspace_cleanup()
@@ -96,6 +97,20 @@ class TestPortedValidators(unittest.TestCase):
         self.assertTrue(passed)
         self.assertIn("PR found", msg)
 
+    @patch("agent_harness.compliance.subprocess.run")
+    def test_tool_version_parsing(self, mock_run):
+        mock_run.return_value = MagicMock(stdout="gh version 2.45.0 (2024-03-04)\n", stderr="")
+        self.assertEqual(check_tool_version("gh", "2.40.0"), (True, "gh version 2.45.0 is OK"))
+
+        # Non-standard output falls back to the generic pattern
+        mock_run.return_value = MagicMock(stdout="git version 2.45.0-rc1\n", stderr="")
+        self.assertEqual(check_tool_version("git", "2.0.0"), (True, "git version 2.45.0 is OK"))
+
+        mock_run.return_value = MagicMock(stdout="bd version 0.0.9 (dev)\n", stderr="")
+        passed, msg = check_tool_version("bd", "0.1.0")
+        self.assertFalse(passed)
+        self.assertIn("too old", msg)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,281 @@
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from agent_harness.session_tracker import SessionTracker
+
+
+@pytest.fixture
+def tracker(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return SessionTracker()
+
+
+def test_session_dir_resolved_from_cwd_on_first_use(tmp_path, monkeypatch):
+    tracker = SessionTracker()
+    monkeypatch.chdir(tmp_path)
+
+    assert tracker.session_dir == tmp_path / ".agent" / "sessions"
+    assert tracker.session_dir.is_dir()
+    assert tracker.session_file == tracker.session_dir / "session.lock"
+
+    # Cached once resolved
+    monkeypatch.chdir(tmp_path / ".agent")
+    assert tracker.session_dir == tmp_path / ".agent" / "sessions"
+
+
+def test_session_dir_override_is_used(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    override = tmp_path / "elsewhere"
+    monkeypatch.setattr(SessionTracker, "SESSION_DIR_OVERRIDE", override)
+
+    tracker = SessionTracker()
+
+    assert tracker.session_dir == override
+    assert tracker.session_log == override / "sessions.jsonl"
+    assert override.is_dir()
+
+
+def _touch(root, *paths):
+    for rel in paths:
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+
+
+def test_scan_workspace_matches_patterns_at_any_depth(tracker, tmp_path):
+    (tmp_path / ".harness").mkdir()
+    tracker.PATTERNS_FILE.write_text("# comment\n*.tmp\ndebug_*\n.harness/session_*.lock\n")
+    _touch(
+        tmp_path,
+        "top.tmp",
+        "a/b/debug_log.txt",
+        "a/keep.py",
+        ".harness/session_1.lock",
+        "sub/.harness/session_2.lock",
+        "sub/session_3.lock",
+    )
+
+    assert tracker._scan_workspace() == [
+        ".harness/session_1.lock",
+        "a/b/debug_log.txt",
+        "sub/.harness/session_2.lock",
+        "top.tmp",
+    ]
+
+
+def test_scan_workspace_skips_excluded_directories(tracker, tmp_path):
+    (tmp_path / ".harness").mkdir()
+    tracker.PATTERNS_FILE.write_text("*.tmp\n")
+    _touch(
+        tmp_path,
+        ".git/objects/x.tmp",
+        ".github/y.tmp",
+        "node_modules/pkg/z.tmp",
+        ".venv/lib/w.tmp",
+        "src/__pycache__/v.tmp",
+        "src/kept.tmp",
+    )
+
+    assert tracker._scan_workspace() == ["src/kept.tmp"]
+
+
+def test_scan_workspace_without_patterns_file(tracker, tmp_path):
+    _touch(tmp_path, "top.tmp")
+
+    assert tracker._scan_workspace() == []
+
+
+def test_compiled_patterns_reused_until_file_changes(tracker, tmp_path):
+    (tmp_path / ".harness").mkdir()
+    tracker.PATTERNS_FILE.write_text("*.tmp\n")
+    _touch(tmp_path, "a.tmp", "b.bak")
+
+    first = tracker._compiled_patterns()
+    assert tracker._compiled_patterns() is first
+    assert tracker._scan_workspace() == ["a.tmp"]
+
+    tracker.PATTERNS_FILE.write_text("*.tmp\n*.bak\n")
+
+    assert tracker._compiled_patterns() is not first
+    assert tracker._scan_workspace() == ["a.tmp", "b.bak"]
+
+
+def test_get_session_reads_lock_once(tracker):
+    tracker.init_session("dev", "agent-1")
+
+    with patch.object(
+        SessionTracker, "_read_session_unchecked", wraps=tracker._read_session_unchecked
+    ) as read:
+        session = tracker.get_session()
+
+    assert session["issue_id"] == "agent-1"
+    read.assert_called_once()
+
+
+def test_expired_session_is_closed(tracker):
+    tracker.init_session("dev", "agent-1")
+    session = json.loads(tracker.session_file.read_text())
+    session["started_at"] -= 9 * 3600
+    tracker.session_file.write_text(json.dumps(session))
+
+    assert tracker.has_active_session() is False
+    assert not tracker.session_file.exists()
+    last_event = json.loads(tracker.session_log.read_text().splitlines()[-1])
+    assert last_event["status"] == "expired"
+
+
+def test_invalid_lock_is_not_active_and_can_be_closed(tracker):
+    tracker.session_file.write_text("not json")
+
+    tracker.close_session(validate_cleanup=False)
+    assert not tracker.session_file.exists()
+
+
+def test_unreadable_lock_is_left_for_its_writer(tracker):
+    # A lock caught mid-write must not be deleted out from under its writer
+    tracker.session_file.write_text('{"id": "sess')
+
+    assert tracker.get_session() is None
+    assert tracker.session_file.exists()
+
+
+def test_expired_session_closes_without_cleanup_validation(tracker):
+    tracker.init_session("dev", "agent-1")
+    session = json.loads(tracker.session_file.read_text())
+    session["started_at"] -= 9 * 3600
+    tracker.session_file.write_text(json.dumps(session))
+
+    with patch.object(SessionTracker, "validate_finalization") as validate:
+        assert tracker.get_session() is None
+
+    validate.assert_not_called()
+    assert not tracker.session_file.exists()
+
+
+def test_init_session_writes_lock_atomically(tracker):
+    with patch("agent_harness.session_tracker.os.replace", wraps=os.replace) as replace:
+        session_id = tracker.init_session("dev", "agent-1")
+
+    replace.assert_called_once()
+    tmp, target = replace.call_args.args
+    assert Path(tmp).parent == tracker.session_dir
+    assert target == tracker.session_file
+    assert json.loads(tracker.session_file.read_text())["id"] == session_id
+    assert list(tracker.session_dir.glob("*.tmp")) == []
+
+
+def test_failed_lock_write_removes_temp_file(tracker):
+    with patch("agent_harness.session_tracker.os.replace", side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            tracker.init_session("dev", "agent-1")
+
+    assert not tracker.session_file.exists()
+    assert list(tracker.session_dir.glob("*.tmp")) == []
+
+
+def test_session_files_use_compact_utf8_json(tracker):
+    tracker.init_session("dev", "agent-ü")
+
+    lock = tracker.session_file.read_text(encoding="utf-8")
+    assert ", " not in lock and '": ' not in lock
+    assert '"issue_id":"agent-ü"' in lock
+    assert '"event":"session_started"' in tracker.session_log.read_text(encoding="utf-8")
+
+
+def test_session_log_descriptor_reused_and_reopened(tracker):
+    log_path = os.path.abspath(tracker.session_log)
+
+    def log_opens():
+        return [c for c in open_.call_args_list if os.fspath(c.args[0]) == log_path]
+
+    with patch("agent_harness.session_tracker.os.open", wraps=os.open) as open_:
+        tracker.init_session("dev", "agent-1")
+        tracker.close_session(validate_cleanup=False)
+        assert len(log_opens()) == 1
+
+        tracker.session_log.unlink()
+        tracker.init_session("dev", "agent-2")
+        assert len(log_opens()) == 2
+
+    events = [json.loads(line) for line in tracker.session_log.read_text().splitlines()]
+    assert [(e["issue_id"], e["event"]) for e in events] == [("agent-2", "session_started")]
+
+
+def test_close_without_lock_skips_validation(tracker):
+    with patch.object(SessionTracker, "validate_finalization") as validate:
+        tracker.close_session()
+
+    validate.assert_not_called()
+    assert not tracker.session_log.exists()
+
+
+def test_session_start_scan_stops_at_limit(tracker, tmp_path):
+    (tmp_path / ".harness").mkdir()
+    tracker.PATTERNS_FILE.write_text("*.tmp\n")
+    _touch(tmp_path, *(f"d{i}/f{j}.tmp" for i in range(5) for j in range(5)))
+
+    validation = tracker.validate_session_start(limit=3)
+    assert validation.truncated is True
+    assert len(validation.violations) == 3
+
+    complete = tracker.validate_session_start(limit=None)
+    assert complete.truncated is False
+    assert len(complete.violations) == 25
+
+
+def test_truncated_session_start_cleanup_removes_everything(tracker, tmp_path):
+    (tmp_path / ".harness").mkdir()
+    tracker.PATTERNS_FILE.write_text("*.tmp\n")
+    _touch(tmp_path, *(f"f{j}.tmp" for j in range(6)))
+
+    validation = tracker.validate_session_start(limit=2)
+    tracker.handle_session_start_violations(validation, force=True)
+
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_truncated_session_start_override_logs_full_count(tracker, tmp_path, monkeypatch):
+    monkeypatch.delenv("HARNESS_SESSION_START_CHOICE", raising=False)
+    (tmp_path / ".harness").mkdir()
+    tracker.PATTERNS_FILE.write_text("*.tmp\n")
+    _touch(tmp_path, *(f"f{j}.tmp" for j in range(6)))
+
+    validation = tracker.validate_session_start(limit=2)
+    with patch("agent_harness.session_tracker.sys.stdin.isatty", return_value=False):
+        tracker.handle_session_start_violations(validation)
+
+    entry = json.loads((tmp_path / ".harness" / "cleanup_overrides.log").read_text())
+    assert entry["violations_count"] == 6
+
+
+def test_finalization_skip_is_decided_at_construction(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    for var in ("RUNNING_IN_CI", "CI", "HARNESS_SKIP_CLEANUP", "PYTEST_CURRENT_TEST"):
+        monkeypatch.delenv(var, raising=False)
+    (tmp_path / ".harness").mkdir()
+    (tmp_path / ".harness" / "cleanup_patterns.txt").write_text("*.tmp\n")
+    _touch(tmp_path, "left.tmp")
+
+    tracker = SessionTracker()
+    monkeypatch.setenv("HARNESS_SKIP_CLEANUP", "1")
+
+    validation = tracker.validate_finalization()
+    assert validation.passed is False
+    assert validation.violations == ["left.tmp"]
+    assert SessionTracker().validate_finalization().passed is True
+
+
+def test_cleanup_removes_files_dirs_and_links(tracker, tmp_path):
+    _touch(tmp_path, "a.tmp", "debug_dir/inner/b.tmp", "keep/target.txt")
+    (tmp_path / "link.tmp").symlink_to(tmp_path / "keep")
+
+    tracker._cleanup_violations(
+        ["a.tmp", "debug_dir", "debug_dir/inner/b.tmp", "link.tmp", "missing.tmp"]
+    )
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["keep"]
+    assert (tmp_path / "keep" / "target.txt").exists()
@@ -1,9 +1,13 @@
 import json
 import subprocess
+import time
 
+from agent_harness import compliance
 from agent_harness.compliance import (
     check_beads_pr_sync,
+    check_child_pr_linkage,
     check_no_separate_review_issues,
+    check_pr_decomposition_closure,
 )
 
 
@@ -51,6 +55,32 @@ def test_check_no_separate_review_issues_pass(tmp_path, monkeypatch):
     assert "No separate PR review issues detected" in msg
 
 
+def test_check_no_separate_review_issues_json(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    monkeypatch.setattr("agent_harness.compliance.get_active_issue_id", lambda: "issue-123")
+
+    def mock_run(args, **kwargs):
+        if args == ["bd", "list", "--status", "open", "--json"]:
+            return MockResult(
+                json.dumps(
+                    [
+                        {"id": "issue-123", "title": "Main task"},
+                        {"id": "issue-456", "title": "Code Review for issue-123"},
+                    ]
+                ).encode()
+            )
+        return MockResult(b"", returncode=1)
+
+    monkeypatch.setattr(subprocess, "run", mock_run)
+    monkeypatch.setattr("agent_harness.compliance.check_tool_available", lambda x: True)
+
+    passed, msg = check_no_separate_review_issues()
+    assert not passed
+    assert "issue-456" in msg
+    assert "issue-123," not in msg
+
+
 def test_check_beads_pr_sync_missing_comment(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
 
@@ -69,11 +99,11 @@ def test_check_beads_pr_sync_missing_comment(tmp_path, monkeypatch):
                         "body": "References issue-123",
                         "url": "https://github.com/org/repo/pull/1",
                     }
-                )
+                ).encode()
             )
         if args[:3] == ["bd", "show", "issue-123"]:
             # No PR URL in the show output
-            return MockResult("issue-123 details\nNo comments yet.")
+            return MockResult(b"issue-123 details\nNo comments yet.")
         return MockResult("")
 
     monkeypatch.setattr(subprocess, "run", mock_run)
@@ -101,10 +131,10 @@ def test_check_beads_pr_sync_success(tmp_path, monkeypatch):
                         "body": "References issue-123",
                         "url": "https://github.com/org/repo/pull/1",
                     }
-                )
+                ).encode()
             )
         if args[:3] == ["bd", "show", "issue-123"]:
-            return MockResult("issue-123 details\nPR: https://github.com/org/repo/pull/1")
+            return MockResult(b"issue-123 details\nPR: https://github.com/org/repo/pull/1")
         return MockResult("")
 
     monkeypatch.setattr(subprocess, "run", mock_run)
@@ -114,6 +144,111 @@ def test_check_beads_pr_sync_success(tmp_path, monkeypatch):
     assert "properly synchronized" in msg
 
 
+def test_check_pr_decomposition_closure_open_original_pr(monkeypatch):
+    monkeypatch.setattr("agent_harness.compliance.get_active_issue_id", lambda: "issue-123")
+    monkeypatch.setattr("agent_harness.compliance.check_tool_available", lambda x: True)
+
+    issue = {
+        "id": "issue-123",
+        "description": "Split out of PR #42",
+        "dependents": [{"id": "issue-124", "dependency_type": "parent-child"}],
+    }
+
+    def mock_run(args, **kwargs):
+        if args[:3] == ["bd", "show", "issue-123"]:
+            return MockResult(json.dumps([issue]).encode())
+        if args[:4] == ["gh", "pr", "view", "42"]:
+            return MockResult("OPEN\n")
+        return MockResult("", returncode=1)
+
+    monkeypatch.setattr(subprocess, "run", mock_run)
+
+    passed, msg = check_pr_decomposition_closure()
+    assert not passed
+    assert "PR #42 is still OPEN" in msg
+
+
+def test_check_child_pr_linkage_requires_parent_reference(monkeypatch):
+    monkeypatch.setattr("agent_harness.compliance.get_active_issue_id", lambda: "issue-124")
+    monkeypatch.setattr("agent_harness.compliance.check_tool_available", lambda x: True)
+    monkeypatch.setattr(
+        "agent_harness.compliance.check_branch_info", lambda: ("agent/issue-124", True)
+    )
+
+    issue = {
+        "id": "issue-124",
+        "dependencies": [
+            {"id": "issue-100", "dependency_type": "blocks"},
+            {"id": "issue-123", "dependency_type": "parent-child"},
+        ],
+    }
+    pr_body = ["Implements the child task"]
+
+    def mock_run(args, **kwargs):
+        if args[:3] == ["bd", "show", "issue-124"]:
+            return MockResult(json.dumps(issue).encode())
+        if args[:3] == ["gh", "pr", "view"]:
+            return MockResult(json.dumps({"body": pr_body[0]}).encode())
+        return MockResult("", returncode=1)
+
+    monkeypatch.setattr(subprocess, "run", mock_run)
+
+    passed, msg = check_child_pr_linkage()
+    assert not passed
+    assert "'issue-123'" in msg
+
+    pr_body[0] = "Part of issue-123"
+    compliance.invalidate_command_cache()  # the PR body was edited
+    passed, msg = check_child_pr_linkage()
+    assert passed
+
+
+def test_bd_and_gh_queries_are_shared_within_a_pass(monkeypatch):
+    monkeypatch.setattr("agent_harness.compliance.get_active_issue_id", lambda: "issue-123")
+    monkeypatch.setattr("agent_harness.compliance.check_tool_available", lambda x: True)
+    monkeypatch.setattr(
+        "agent_harness.compliance.check_branch_info", lambda: ("agent/issue-123", True)
+    )
+
+    calls = []
+
+    def mock_run(args, **kwargs):
+        calls.append(tuple(args))
+        if args[:3] == ["bd", "show", "issue-123"]:
+            return MockResult(json.dumps({"id": "issue-123"}).encode())
+        return MockResult(b"", returncode=1)
+
+    monkeypatch.setattr(subprocess, "run", mock_run)
+
+    check_pr_decomposition_closure()
+    check_child_pr_linkage()
+    assert calls.count(("bd", "show", "issue-123", "--json")) == 1
+
+    compliance.invalidate_command_cache()
+    check_child_pr_linkage()
+    assert calls.count(("bd", "show", "issue-123", "--json")) == 2
+
+
+def test_concurrent_identical_queries_spawn_once(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    calls = []
+
+    def mock_run(args, **kwargs):
+        calls.append(tuple(args))
+        time.sleep(0.05)  # keep the first query in flight while others arrive
+        return MockResult(b"{}")
+
+    monkeypatch.setattr(subprocess, "run", mock_run)
+
+    argv = ("bd", "show", "issue-123", "--json")
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda _: compliance._run_cached(argv), range(4)))
+
+    assert calls == [argv]
+    assert all(r is results[0] for r in results)
+
+
 class MockResult:
     def __init__(self, stdout, returncode=0):
         self.stdout = stdout